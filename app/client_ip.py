@@ -1,5 +1,4 @@
 import ipaddress
-from typing import Iterable
 
 from fastapi import Request
 
@@ -36,17 +35,11 @@ def _parse_ip(candidate: str | None):
 
 def _is_trusted_proxy(candidate: str | None) -> bool:
     ip = _parse_ip(candidate)
-    if ip is None:
-        return False
-    return any(ip in network for network in TRUSTED_PROXY_NETWORKS)
+    return ip is not None and _is_trusted_address(ip)
 
 
-def _iter_forwarded_chain(x_forwarded_for: str, peer_ip: str) -> Iterable[str]:
-    for candidate in x_forwarded_for.split(","):
-        candidate = candidate.strip()
-        if candidate:
-            yield candidate
-    yield peer_ip
+def _is_trusted_address(ip) -> bool:
+    return any(ip in network for network in TRUSTED_PROXY_NETWORKS)
 
 
 def get_client_ip(request: Request) -> str | None:
@@ -58,13 +51,14 @@ def get_client_ip(request: Request) -> str | None:
     if not _is_trusted_proxy(peer_ip):
         return peer_ip
 
+    # Walk X-Forwarded-For right to left: entries appended by our own proxies
+    # are skipped, and the first untrusted hop is the client. Each entry is
+    # parsed once, and the peer itself is already known to be trusted.
     x_forwarded_for = request.headers.get("X-Forwarded-For", "")
-    chain = list(_iter_forwarded_chain(x_forwarded_for, peer_ip))
-
-    for candidate in reversed(chain):
-        if not _parse_ip(candidate):
-            continue
-        if _is_trusted_proxy(candidate):
+    for candidate in reversed(x_forwarded_for.split(",")):
+        candidate = candidate.strip()
+        ip = _parse_ip(candidate)
+        if ip is None or _is_trusted_address(ip):
             continue
         return candidate
 
@@ -54,6 +54,9 @@ def _get_timezone(name: str) -> ZoneInfo:
 @dataclass(frozen=True)
 class Settings:
     database_url: str
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_recycle_seconds: int
     secret_key: str
     api_key: str
     base_url: str
@@ -68,12 +71,20 @@ class Settings:
     smtp_username: str
     smtp_password: str
     notification_email: str
+    email_notifications_enabled: bool
     maxmind_license_key: str
 
 
 def load_settings() -> Settings:
+    smtp_username = os.getenv("SMTP_USERNAME", "")
+    smtp_password = os.getenv("SMTP_PASSWORD", "")
+    notification_email = os.getenv("NOTIFICATION_EMAIL", "")
+
     return Settings(
         database_url=_require_env("DATABASE_URL"),
+        db_pool_size=_get_int("DB_POOL_SIZE", 20, minimum=1),
+        db_max_overflow=_get_int("DB_MAX_OVERFLOW", 40, minimum=0),
+        db_pool_recycle_seconds=_get_int("DB_POOL_RECYCLE_SECONDS", 1800, minimum=1),
         secret_key=_require_env("SECRET_KEY"),
         api_key=_require_env("API_KEY"),
         base_url=_require_env("BASE_URL").rstrip("/"),
@@ -88,9 +99,10 @@ def load_settings() -> Settings:
         ),
         smtp_server=os.getenv("SMTP_SERVER", "smtp.gmail.com"),
         smtp_port=_get_int("SMTP_PORT", 587, minimum=1),
-        smtp_username=os.getenv("SMTP_USERNAME", ""),
-        smtp_password=os.getenv("SMTP_PASSWORD", ""),
-        notification_email=os.getenv("NOTIFICATION_EMAIL", ""),
+        smtp_username=smtp_username,
+        smtp_password=smtp_password,
+        notification_email=notification_email,
+        email_notifications_enabled=bool(smtp_username and smtp_password and notification_email),
         maxmind_license_key=os.getenv("MAXMIND_LICENSE_KEY", ""),
     )
 
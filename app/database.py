@@ -23,7 +23,15 @@ from .open_classification import resolve_missing_open_classification
 
 logger = logging.getLogger(__name__)
 
-engine = create_async_engine(settings.database_url, echo=False)
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+)
 async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 Base = declarative_base()
@@ -45,6 +53,10 @@ STARTUP_INDEX_MIGRATIONS = {
         "ix_tracked_emails_created_at": (
             "CREATE INDEX ix_tracked_emails_created_at ON tracked_emails (created_at)"
         ),
+        "ix_tracked_emails_followup_notified_at_created_at": (
+            "CREATE INDEX ix_tracked_emails_followup_notified_at_created_at "
+            "ON tracked_emails (followup_notified_at, created_at)"
+        ),
     },
     "opens": {
         "ix_opens_is_real_open_opened_at_id": (
@@ -58,6 +70,10 @@ STARTUP_INDEX_MIGRATIONS = {
             "CREATE INDEX ix_opens_tracked_email_id_opened_at_id "
             "ON opens (tracked_email_id, opened_at, id)"
         ),
+        "ix_opens_tracked_email_id_is_real_open_opened_at": (
+            "CREATE INDEX ix_opens_tracked_email_id_is_real_open_opened_at "
+            "ON opens (tracked_email_id, is_real_open, opened_at)"
+        ),
     },
 }
 
@@ -66,6 +82,11 @@ class TrackedEmail(Base):
     __tablename__ = "tracked_emails"
     __table_args__ = (
         Index("ix_tracked_emails_created_at", "created_at"),
+        Index(
+            "ix_tracked_emails_followup_notified_at_created_at",
+            "followup_notified_at",
+            "created_at",
+        ),
     )
 
     id = Column(String(36), primary_key=True)
@@ -87,6 +108,12 @@ class Open(Base):
         Index("ix_opens_is_real_open_opened_at_id", "is_real_open", "opened_at", "id"),
         Index("ix_opens_opened_at_id", "opened_at", "id"),
         Index("ix_opens_tracked_email_id_opened_at_id", "tracked_email_id", "opened_at", "id"),
+        Index(
+            "ix_opens_tracked_email_id_is_real_open_opened_at",
+            "tracked_email_id",
+            "is_real_open",
+            "opened_at",
+        ),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -1,5 +1,8 @@
+import ipaddress
+import logging
 import tarfile
 import httpx
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 import geoip2.database
@@ -8,8 +11,12 @@ import geoip2.errors
 from .config import settings
 from .paths import DATA_DIR
 
+logger = logging.getLogger(__name__)
+
 GEOIP_DIR = DATA_DIR / "geoip"
 DB_PATH = GEOIP_DIR / "GeoLite2-City.mmdb"
+LOOKUP_CACHE_SIZE = 4096
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 # Global reader instance
 _reader: Optional[geoip2.database.Reader] = None
@@ -26,24 +33,25 @@ def get_download_url() -> str:
 async def download_database() -> bool:
     """Download and extract the GeoLite2-City database."""
     if not settings.maxmind_license_key:
-        print("MAXMIND_LICENSE_KEY not set, skipping GeoIP database download")
+        logger.warning("MAXMIND_LICENSE_KEY not set, skipping GeoIP database download")
         return False
 
     try:
         GEOIP_DIR.mkdir(parents=True, exist_ok=True)
 
-        print("Downloading GeoLite2-City database...")
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-            response = await client.get(get_download_url())
-            response.raise_for_status()
-
-        # Save the tar.gz file
+        logger.info("Downloading GeoLite2-City database...")
+        # Stream the tar.gz file to disk so the archive is never held in memory
         tar_path = GEOIP_DIR / "GeoLite2-City.tar.gz"
-        tar_path.write_bytes(response.content)
+        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
+            async with client.stream("GET", get_download_url()) as response:
+                response.raise_for_status()
+                with tar_path.open("wb") as tar_file:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        tar_file.write(chunk)
 
         # Extract the .mmdb file
-        with tarfile.open(tar_path, "r:gz") as tar:
-            for member in tar.getmembers():
+        with tarfile.open(tar_path, "r|gz") as tar:
+            for member in tar:
                 if member.name.endswith(".mmdb"):
                     # Extract just the mmdb file
                     member.name = Path(member.name).name
@@ -57,11 +65,11 @@ async def download_database() -> bool:
         # Clean up tar file
         tar_path.unlink()
 
-        print(f"GeoLite2-City database downloaded to {DB_PATH}")
+        logger.info("GeoLite2-City database downloaded to %s", DB_PATH)
         return True
 
     except Exception as e:
-        print(f"Failed to download GeoIP database: {e}")
+        logger.error("Failed to download GeoIP database: %s", e)
         return False
 
 
@@ -76,13 +84,22 @@ def get_reader() -> Optional[geoip2.database.Reader]:
         return None
 
     try:
-        _reader = geoip2.database.Reader(str(DB_PATH))
+        _reader = _open_reader()
         return _reader
     except Exception as e:
-        print(f"Failed to open GeoIP database: {e}")
+        logger.error("Failed to open GeoIP database: %s", e)
         return None
 
 
+def _open_reader() -> geoip2.database.Reader:
+    """Prefer the libmaxminddb C extension, falling back to the default mode."""
+    try:
+        return geoip2.database.Reader(str(DB_PATH), mode=geoip2.database.MODE_MMAP_EXT)
+    except ValueError as e:
+        logger.warning("GeoIP C extension unavailable, using default reader mode: %s", e)
+        return geoip2.database.Reader(str(DB_PATH))
+
+
 def lookup_ip(ip_address: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Look up country and city for an IP address.
@@ -92,24 +109,40 @@ def lookup_ip(ip_address: str) -> Tuple[Optional[str], Optional[str]]:
     if reader is None:
         return None, None
 
+    # Reject malformed addresses before touching the database
+    try:
+        addr = ipaddress.ip_address(ip_address)
+    except ValueError:
+        return None, None
+
     # Skip private/local IPs
-    if ip_address.startswith(("127.", "10.", "192.168.", "172.16.", "172.17.",
-                               "172.18.", "172.19.", "172.20.", "172.21.",
-                               "172.22.", "172.23.", "172.24.", "172.25.",
-                               "172.26.", "172.27.", "172.28.", "172.29.",
-                               "172.30.", "172.31.", "::1", "fc", "fd")):
+    if addr.is_private or addr.is_loopback or addr.is_link_local or addr.is_multicast:
+        return None, None
+
+    try:
+        return _lookup_cached(addr)
+    except Exception as e:
+        logger.debug("GeoIP lookup error for %s: %s", ip_address, e)
+        return None, None
+
+
+@lru_cache(maxsize=LOOKUP_CACHE_SIZE)
+def _lookup_cached(
+    ip_address: ipaddress.IPv4Address | ipaddress.IPv6Address,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Resolve an IP against the open reader, memoizing the (country, city) tuple.
+    Unexpected reader errors propagate so they are never cached.
+    """
+    reader = get_reader()
+    if reader is None:
         return None, None
 
     try:
         response = reader.city(ip_address)
-        country = response.country.name
-        city = response.city.name
-        return country, city
     except geoip2.errors.AddressNotFoundError:
         return None, None
-    except Exception as e:
-        print(f"GeoIP lookup error for {ip_address}: {e}")
-        return None, None
+    return response.country.name, response.city.name
 
 
 async def init_geoip():
@@ -117,9 +150,10 @@ async def init_geoip():
     if not DB_PATH.exists():
         await download_database()
 
-    # Try to open the reader
+    # Try to open the reader; drop lookups cached against any previous database
     reader = get_reader()
+    _lookup_cached.cache_clear()
     if reader:
-        print("GeoIP database ready")
+        logger.info("GeoIP database ready")
     else:
-        print("GeoIP database not available")
+        logger.warning("GeoIP database not available")
@@ -10,9 +10,11 @@ from starlette.middleware.sessions import SessionMiddleware
 from .config import settings
 from .database import check_database_health, init_database
 from .geoip import init_geoip
+from .notifications import close_smtp_connections
 from .paths import STATIC_DIR
 from .routes import api, dashboard, pixel
 from .services.followups import check_followup_reminders
+from .web import warm_templates
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,8 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize GeoIP database
     await init_geoip()
 
+    warm_templates()
+
     # Start background task for follow-up reminders
     task = asyncio.create_task(followup_reminder_task())
     logger.info("Follow-up reminder background task started")
@@ -48,12 +52,29 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
+    await close_smtp_connections()
+
+
+# Routes that never read request.session. Browsers still send the dashboard
+# cookie to these paths, so skipping them saves a signature check per request.
+SESSIONLESS_PATH_PREFIXES = ("/p/", "/api/", "/static/", "/health")
+
+
+class DashboardSessionMiddleware(SessionMiddleware):
+    """Session middleware that leaves pixel, API and static requests untouched."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(SESSIONLESS_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 
 app = FastAPI(title="Mailtrack", docs_url=None, redoc_url=None, lifespan=lifespan)
 
 # Session middleware for dashboard auth with secure cookie flags
 app.add_middleware(
-    SessionMiddleware,
+    DashboardSessionMiddleware,
     secret_key=settings.secret_key,
     https_only=settings.cookie_secure,
     same_site="lax",
@@ -1,50 +1,155 @@
 """Email notification module for open alerts."""
-import smtplib
+import asyncio
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 from datetime import datetime
 
+import aiosmtplib
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
 from .config import settings
+from .paths import TEMPLATES_DIR
 
 logger = logging.getLogger(__name__)
 
+ELAPSED_UNITS = ((86400, "day"), (3600, "hour"), (60, "minute"), (1, "second"))
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Small pool of long-lived SMTP connections; the semaphore caps concurrent sends
+SMTP_POOL_SIZE = 4
+_idle_smtp: list[aiosmtplib.SMTP] = []
+_smtp_slots = asyncio.Semaphore(SMTP_POOL_SIZE)
+
+# Email bodies are compiled once at import; HTML variants autoescape user-supplied values
+_email_templates = Environment(
+    loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    autoescape=select_autoescape(["html"]),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+EMAIL_TEMPLATES = {
+    name: (
+        _email_templates.get_template(f"emails/{name}.html"),
+        _email_templates.get_template(f"emails/{name}.txt"),
+    )
+    for name in (
+        "open_notification",
+        "followup_reminder",
+        "hot_conversation",
+        "revived_conversation",
+    )
+}
+
+
+def _pluralize(count: int, unit_name: str) -> str:
+    return f"{count} {unit_name}{'s' if count != 1 else ''}"
+
 
 def format_time_elapsed(sent_at: datetime, opened_at: datetime) -> str:
     """Format the time elapsed between sending and opening in a human-readable way."""
-    delta = opened_at - sent_at
-    total_seconds = int(delta.total_seconds())
-
-    if total_seconds < 0:
-        return "immediately"
+    total_seconds = int((opened_at - sent_at).total_seconds())
 
-    days = total_seconds // 86400
-    hours = (total_seconds % 86400) // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    # Show the largest non-zero unit, followed by the next smaller unit when it is non-zero
+    for index, (unit_seconds, unit_name) in enumerate(ELAPSED_UNITS):
+        count, remainder = divmod(total_seconds, unit_seconds)
+        if count <= 0:
+            continue
 
-    parts = []
+        parts = [_pluralize(count, unit_name)]
+        if index + 1 < len(ELAPSED_UNITS):
+            next_unit_seconds, next_unit_name = ELAPSED_UNITS[index + 1]
+            next_count = remainder // next_unit_seconds
+            if next_count:
+                parts.append(_pluralize(next_count, next_unit_name))
+        return ", ".join(parts)
 
-    if days > 0:
-        parts.append(f"{days} day{'s' if days != 1 else ''}")
-    if hours > 0:
-        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-    if minutes > 0 and days == 0:  # Only show minutes if less than a day
-        parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-    if seconds > 0 and days == 0 and hours == 0:  # Only show seconds if less than an hour
-        parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
+    return "immediately"
 
-    if not parts:
-        return "immediately"
+def format_notification_time(dt: datetime) -> str:
+    """Equivalent to strftime('%B %d, %Y at %I:%M %p') without the format interpreter."""
+    hour_12 = dt.hour % 12 or 12
+    meridiem = "AM" if dt.hour < 12 else "PM"
+    return f"{MONTH_NAMES[dt.month - 1]} {dt.day:02d}, {dt.year} at {hour_12:02d}:{dt.minute:02d} {meridiem}"
 
-    return ", ".join(parts)
 
 def is_email_notifications_enabled() -> bool:
     """Check if email notifications are configured."""
-    return bool(settings.smtp_username and settings.smtp_password and settings.notification_email)
+    return settings.email_notifications_enabled
+
+
+def _render_bodies(template_name: str, **context) -> tuple[str, str]:
+    html_template, text_template = EMAIL_TEMPLATES[template_name]
+    return html_template.render(context), text_template.render(context)
+
+
+def _build_message(email_subject: str, text_body: str, html_body: str) -> EmailMessage:
+    msg = EmailMessage()
+    msg["Subject"] = email_subject
+    msg["From"] = settings.smtp_username
+    msg["To"] = settings.notification_email
+
+    # Quoted-printable keeps emoji bodies 7-bit clean for servers without 8BITMIME
+    msg.set_content(text_body, cte="quoted-printable")
+    msg.add_alternative(html_body, subtype="html", cte="quoted-printable")
+    return msg
+
+
+async def _connect_smtp() -> aiosmtplib.SMTP:
+    server = aiosmtplib.SMTP(
+        hostname=settings.smtp_server,
+        port=settings.smtp_port,
+        start_tls=True,
+    )
+    await server.connect()
+    try:
+        await server.login(settings.smtp_username, settings.smtp_password)
+    except Exception:
+        server.close()
+        raise
+    return server
 
 
-def send_open_notification(
+async def _quit_smtp(server: aiosmtplib.SMTP) -> None:
+    try:
+        await server.quit()
+    except Exception:
+        server.close()
+
+
+async def _send_message(msg: EmailMessage) -> None:
+    """Send over a pooled connection, reconnecting once if the server dropped it."""
+    async with _smtp_slots:
+        server = _idle_smtp.pop() if _idle_smtp else None
+        for attempt in range(2):
+            if server is None:
+                server = await _connect_smtp()
+            try:
+                await server.sendmail(settings.smtp_username, settings.notification_email, msg.as_string())
+            except aiosmtplib.SMTPServerDisconnected:
+                server = None
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                await _quit_smtp(server)
+                raise
+
+            _idle_smtp.append(server)
+            return
+
+
+async def close_smtp_connections() -> None:
+    """Close every idle pooled SMTP connection."""
+    while _idle_smtp:
+        await _quit_smtp(_idle_smtp.pop())
+
+
+async def send_open_notification(
     recipient: str,
     subject: str,
     opened_at: datetime,
@@ -80,61 +185,21 @@ def send_open_notification(
     else:
         email_subject = f"{recipient_name} read your message: {subject or '(no subject)'}"
 
-    html_body = f"""
-    <html>
-    <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px;">
-        <h2 style="color: #27ae60;">{recipient_name} read your message!</h2>
-        {f'<p style="font-size: 18px; color: #333;"><strong>{elapsed}</strong> after you sent it</p>' if elapsed else ''}
-        <table style="border-collapse: collapse; margin-top: 15px;">
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">To:</td>
-                <td style="padding: 8px 0;">{recipient or 'Unknown'}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">Subject:</td>
-                <td style="padding: 8px 0;">{subject or '(no subject)'}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">Opened:</td>
-                <td style="padding: 8px 0;">{opened_at.strftime('%B %d, %Y at %I:%M %p')}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">Location:</td>
-                <td style="padding: 8px 0;">{location}</td>
-            </tr>
-        </table>
-        <p style="margin-top: 20px; color: #888; font-size: 12px;">
-            This is the first real open (excluding email privacy proxies).
-        </p>
-    </body>
-    </html>
-    """
-
-    text_body = f"""
-{recipient_name} read your message!
-{f"{elapsed} after you sent it" if elapsed else ""}
-
-To: {recipient or 'Unknown'}
-Subject: {subject or '(no subject)'}
-Opened: {opened_at.strftime('%B %d, %Y at %I:%M %p')}
-Location: {location}
-
-This is the first real open (excluding email privacy proxies).
-    """
+    html_body, text_body = _render_bodies(
+        "open_notification",
+        recipient_name=recipient_name,
+        elapsed=elapsed,
+        details=[
+            ("To", recipient or "Unknown"),
+            ("Subject", subject or "(no subject)"),
+            ("Opened", format_notification_time(opened_at)),
+            ("Location", location),
+        ],
+        footer="This is the first real open (excluding email privacy proxies).",
+    )
 
     try:
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = email_subject
-        msg["From"] = settings.smtp_username
-        msg["To"] = settings.notification_email
-
-        msg.attach(MIMEText(text_body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
-
-        with smtplib.SMTP(settings.smtp_server, settings.smtp_port) as server:
-            server.starttls()
-            server.login(settings.smtp_username, settings.smtp_password)
-            server.sendmail(settings.smtp_username, settings.notification_email, msg.as_string())
+        await _send_message(_build_message(email_subject, text_body, html_body))
 
         logger.info(f"Open notification sent for track {track_id}")
         return True
@@ -144,7 +209,7 @@ This is the first real open (excluding email privacy proxies).
         return False
 
 
-def send_followup_reminder(
+async def send_followup_reminder(
     recipient: str,
     subject: str,
     sent_at: datetime,
@@ -163,59 +228,19 @@ def send_followup_reminder(
     # Format the email
     email_subject = f"Follow-up Reminder: {subject or '(no subject)'}"
 
-    html_body = f"""
-    <html>
-    <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px;">
-        <h2 style="color: #e67e22;">Time to follow up?</h2>
-        <p style="color: #555; font-size: 16px;">
-            Your email hasn't been opened in <strong>{days_ago} days</strong>. Consider sending a follow-up!
-        </p>
-        <table style="border-collapse: collapse; margin-top: 15px;">
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">To:</td>
-                <td style="padding: 8px 0;">{recipient or 'Unknown'}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">Subject:</td>
-                <td style="padding: 8px 0;">{subject or '(no subject)'}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">Sent:</td>
-                <td style="padding: 8px 0;">{sent_at.strftime('%B %d, %Y at %I:%M %p')}</td>
-            </tr>
-        </table>
-        <p style="margin-top: 20px; color: #888; font-size: 12px;">
-            This email has not been opened (excluding automated proxy prefetches).
-        </p>
-    </body>
-    </html>
-    """
-
-    text_body = f"""
-Time to follow up?
-
-Your email hasn't been opened in {days_ago} days. Consider sending a follow-up!
-
-To: {recipient or 'Unknown'}
-Subject: {subject or '(no subject)'}
-Sent: {sent_at.strftime('%B %d, %Y at %I:%M %p')}
-
-This email has not been opened (excluding automated proxy prefetches).
-    """
+    html_body, text_body = _render_bodies(
+        "followup_reminder",
+        days_ago=days_ago,
+        details=[
+            ("To", recipient or "Unknown"),
+            ("Subject", subject or "(no subject)"),
+            ("Sent", format_notification_time(sent_at)),
+        ],
+        footer="This email has not been opened (excluding automated proxy prefetches).",
+    )
 
     try:
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = email_subject
-        msg["From"] = settings.smtp_username
-        msg["To"] = settings.notification_email
-
-        msg.attach(MIMEText(text_body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
-
-        with smtplib.SMTP(settings.smtp_server, settings.smtp_port) as server:
-            server.starttls()
-            server.login(settings.smtp_username, settings.smtp_password)
-            server.sendmail(settings.smtp_username, settings.notification_email, msg.as_string())
+        await _send_message(_build_message(email_subject, text_body, html_body))
 
         logger.info(f"Follow-up reminder sent for track {track_id}")
         return True
@@ -225,7 +250,7 @@ This email has not been opened (excluding automated proxy prefetches).
         return False
 
 
-def send_hot_conversation_notification(
+async def send_hot_conversation_notification(
     recipient: str,
     subject: str,
     open_count: int,
@@ -245,51 +270,18 @@ def send_hot_conversation_notification(
     # Format the email
     email_subject = f"🔥 Hot conversation! {recipient_name} opened your email {open_count} times today"
 
-    html_body = f"""
-    <html>
-    <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px;">
-        <h2 style="color: #e74c3c;">🔥 Hot conversation!</h2>
-        <p style="font-size: 18px; color: #333;">
-            <strong>{recipient_name}</strong> has opened your email <strong>{open_count} times</strong> in the last 24 hours.
-        </p>
-        <p style="color: #555;">They're clearly interested - this might be a good time to follow up!</p>
-        <table style="border-collapse: collapse; margin-top: 15px;">
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">To:</td>
-                <td style="padding: 8px 0;">{recipient or 'Unknown'}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">Subject:</td>
-                <td style="padding: 8px 0;">{subject or '(no subject)'}</td>
-            </tr>
-        </table>
-    </body>
-    </html>
-    """
-
-    text_body = f"""
-🔥 Hot conversation!
-
-{recipient_name} has opened your email {open_count} times in the last 24 hours.
-They're clearly interested - this might be a good time to follow up!
-
-To: {recipient or 'Unknown'}
-Subject: {subject or '(no subject)'}
-    """
+    html_body, text_body = _render_bodies(
+        "hot_conversation",
+        recipient_name=recipient_name,
+        open_count=open_count,
+        details=[
+            ("To", recipient or "Unknown"),
+            ("Subject", subject or "(no subject)"),
+        ],
+    )
 
     try:
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = email_subject
-        msg["From"] = settings.smtp_username
-        msg["To"] = settings.notification_email
-
-        msg.attach(MIMEText(text_body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
-
-        with smtplib.SMTP(settings.smtp_server, settings.smtp_port) as server:
-            server.starttls()
-            server.login(settings.smtp_username, settings.smtp_password)
-            server.sendmail(settings.smtp_username, settings.notification_email, msg.as_string())
+        await _send_message(_build_message(email_subject, text_body, html_body))
 
         logger.info(f"Hot conversation notification sent for track {track_id}")
         return True
@@ -299,7 +291,7 @@ Subject: {subject or '(no subject)'}
         return False
 
 
-def send_revived_conversation_notification(
+async def send_revived_conversation_notification(
     recipient: str,
     subject: str,
     days_since_first_open: int,
@@ -319,51 +311,18 @@ def send_revived_conversation_notification(
     # Format the email
     email_subject = f"🔄 Old conversation revived! {recipient_name} re-opened your email after {days_since_first_open} days"
 
-    html_body = f"""
-    <html>
-    <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px;">
-        <h2 style="color: #9b59b6;">🔄 Old conversation revived!</h2>
-        <p style="font-size: 18px; color: #333;">
-            <strong>{recipient_name}</strong> just re-opened your email from <strong>{days_since_first_open} days ago</strong>.
-        </p>
-        <p style="color: #555;">They're thinking about this again - might be worth reaching out!</p>
-        <table style="border-collapse: collapse; margin-top: 15px;">
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">To:</td>
-                <td style="padding: 8px 0;">{recipient or 'Unknown'}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px 15px 8px 0; color: #666; font-weight: bold;">Subject:</td>
-                <td style="padding: 8px 0;">{subject or '(no subject)'}</td>
-            </tr>
-        </table>
-    </body>
-    </html>
-    """
-
-    text_body = f"""
-🔄 Old conversation revived!
-
-{recipient_name} just re-opened your email from {days_since_first_open} days ago.
-They're thinking about this again - might be worth reaching out!
-
-To: {recipient or 'Unknown'}
-Subject: {subject or '(no subject)'}
-    """
+    html_body, text_body = _render_bodies(
+        "revived_conversation",
+        recipient_name=recipient_name,
+        days_since_first_open=days_since_first_open,
+        details=[
+            ("To", recipient or "Unknown"),
+            ("Subject", subject or "(no subject)"),
+        ],
+    )
 
     try:
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = email_subject
-        msg["From"] = settings.smtp_username
-        msg["To"] = settings.notification_email
-
-        msg.attach(MIMEText(text_body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
-
-        with smtplib.SMTP(settings.smtp_server, settings.smtp_port) as server:
-            server.starttls()
-            server.login(settings.smtp_username, settings.smtp_password)
-            server.sendmail(settings.smtp_username, settings.notification_email, msg.as_string())
+        await _send_message(_build_message(email_subject, text_body, html_body))
 
         logger.info(f"Revived conversation notification sent for track {track_id}")
         return True
@@ -8,7 +8,7 @@ from .time_utils import ensure_utc
 SnapshotT = TypeVar("SnapshotT", bound="StoredOpenSnapshot")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoredOpenSnapshot:
     opened_at: datetime | None
     ip_address: str | None
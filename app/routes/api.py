@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, List
 from datetime import datetime, timezone
 
@@ -52,6 +52,9 @@ class OpenResponse(BaseModel):
     is_real_open: bool
 
 
+_OPEN_RESPONSES_ADAPTER = TypeAdapter(List[OpenResponse])
+
+
 class TrackResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -110,18 +113,9 @@ def _parse_since_timestamp(since: float | None) -> datetime | None:
         raise HTTPException(status_code=422, detail="Invalid 'since' timestamp") from exc
 
 
-def _build_open_response(open_record: TrackOpenRecord) -> OpenResponse:
-    return OpenResponse(
-        id=open_record.id,
-        opened_at=open_record.opened_at,
-        ip_address=open_record.ip_address,
-        user_agent=open_record.user_agent,
-        referer=open_record.referer,
-        country=open_record.country,
-        city=open_record.city,
-        proxy_type=open_record.proxy_type,
-        is_real_open=open_record.is_real_open,
-    )
+def _build_open_responses(open_records: List[TrackOpenRecord]) -> List[OpenResponse]:
+    # One pydantic-core pass over the whole list instead of a model per row.
+    return _OPEN_RESPONSES_ADAPTER.validate_python(open_records, from_attributes=True)
 
 
 def _build_track_response_fields(
@@ -191,7 +185,7 @@ async def get_track(
     track, opens = await get_track_with_opens(db, track_id)
     return TrackDetailResponse(
         **_build_track_response_fields(track, open_count=len(opens)),
-        opens=[_build_open_response(open_record) for open_record in opens],
+        opens=_build_open_responses(opens),
     )
 
 
@@ -202,7 +196,7 @@ async def get_track_opens(
     _auth: bool = Depends(verify_api_key)
 ):
     opens = await list_track_open_records(db, track_id)
-    return [_build_open_response(open_record) for open_record in opens]
+    return _build_open_responses(opens)
 
 
 @router.delete("/tracks/{track_id}")
@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, Form, Request
+import hashlib
+import hmac
+import time
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..client_ip import get_client_ip
 from ..config import settings
 from ..database import get_db
 from ..services.analytics import build_analytics_context, export_analytics_csv
@@ -14,32 +20,118 @@ from ..services.dashboard import (
     update_track_notes,
 )
 from ..services.recipients import build_recipient_detail_context, build_recipients_context
-from ..web import render_template
+from ..web import render_template, templates
 
 router = APIRouter()
 
+# Digests of the configured credentials, compared in constant time on login.
+_DASHBOARD_USERNAME_DIGEST = hashlib.sha256(settings.dashboard_username.encode("utf-8")).digest()
+_DASHBOARD_PASSWORD_DIGEST = hashlib.sha256(settings.dashboard_password.encode("utf-8")).digest()
+
+# Failed logins per client IP: (failure count, window start as monotonic time).
+LOGIN_MAX_FAILURES = 10
+LOGIN_FAILURE_WINDOW_SECONDS = 300
+LOGIN_FAILURE_TRACKED_CLIENTS = 10_000
+_login_failures: dict[str, tuple[int, float]] = {}
+
 
 def is_authenticated(request: Request) -> bool:
     return request.session.get("authenticated", False)
 
 
+def _credentials_match(username: str, password: str) -> bool:
+    username_digest = hashlib.sha256(username.encode("utf-8")).digest()
+    password_digest = hashlib.sha256(password.encode("utf-8")).digest()
+    # Evaluate both comparisons so timing does not reveal which field was wrong.
+    username_matches = hmac.compare_digest(username_digest, _DASHBOARD_USERNAME_DIGEST)
+    password_matches = hmac.compare_digest(password_digest, _DASHBOARD_PASSWORD_DIGEST)
+    return username_matches and password_matches
+
+
+def _is_login_throttled(client_key: str, now: float) -> bool:
+    entry = _login_failures.get(client_key)
+    if entry is None:
+        return False
+    failures, window_start = entry
+    if now - window_start >= LOGIN_FAILURE_WINDOW_SECONDS:
+        del _login_failures[client_key]
+        return False
+    return failures >= LOGIN_MAX_FAILURES
+
+
+def _record_login_failure(client_key: str, now: float) -> None:
+    if client_key not in _login_failures and len(_login_failures) >= LOGIN_FAILURE_TRACKED_CLIENTS:
+        # Drop expired windows; if every tracked client is still active, start over.
+        for key, (_failures, window_start) in list(_login_failures.items()):
+            if now - window_start >= LOGIN_FAILURE_WINDOW_SECONDS:
+                del _login_failures[key]
+        if len(_login_failures) >= LOGIN_FAILURE_TRACKED_CLIENTS:
+            _login_failures.clear()
+
+    failures, window_start = _login_failures.get(client_key, (0, now))
+    _login_failures[client_key] = (failures + 1, window_start)
+
+
 def redirect_to_login() -> RedirectResponse:
     return RedirectResponse(url="/login", status_code=303)
 
 
+# Auth dependency; declared ahead of get_db so anonymous hits never check out a connection
+async def require_auth(request: Request) -> bool:
+    if not is_authenticated(request):
+        raise HTTPException(status_code=303, headers={"Location": "/login"})
+    return True
+
+
+LOGIN_INVALID_CREDENTIALS_ERROR = "Invalid credentials"
+LOGIN_THROTTLED_ERROR = "Too many failed attempts. Try again later."
+
+
+@lru_cache(maxsize=4)
+def _render_static_login_page(error: str | None = None) -> tuple[bytes, str]:
+    """Render each login page variant once; only the fixed error message varies."""
+    body = templates.get_template("login.html").render(error=error).encode("utf-8")
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return body, etag
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 @router.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
     if is_authenticated(request):
         return RedirectResponse(url="/", status_code=303)
-    return render_template(request, "login.html", {"error": None})
+
+    body, etag = _render_static_login_page()
+    # no-cache makes browsers revalidate, so a signed-in user still gets redirected.
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
 
 
 @router.post("/login")
 async def login(request: Request, username: str = Form(...), password: str = Form(...)):
-    if username == settings.dashboard_username and password == settings.dashboard_password:
+    client_key = get_client_ip(request) or "unknown"
+    now = time.monotonic()
+    if _is_login_throttled(client_key, now):
+        body, _etag = _render_static_login_page(LOGIN_THROTTLED_ERROR)
+        return HTMLResponse(body, status_code=429)
+
+    if _credentials_match(username, password):
+        _login_failures.pop(client_key, None)
         request.session["authenticated"] = True
         return RedirectResponse(url="/", status_code=303)
-    return render_template(request, "login.html", {"error": "Invalid credentials"})
+
+    _record_login_failure(client_key, now)
+    body, _etag = _render_static_login_page(LOGIN_INVALID_CREDENTIALS_ERROR)
+    return HTMLResponse(body)
 
 
 @router.get("/logout")
@@ -55,11 +147,9 @@ async def dashboard(
     search: str = "",
     date_range: str = "all",
     page: int = 1,
+    _auth: bool = Depends(require_auth),
     db: AsyncSession = Depends(get_db),
 ):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
     context = await build_dashboard_context(
         db,
         filter_value=filter,
@@ -71,28 +161,34 @@ async def dashboard(
 
 
 @router.get("/detail/{track_id}", response_class=HTMLResponse)
-async def detail_page(request: Request, track_id: str, db: AsyncSession = Depends(get_db)):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
+async def detail_page(
+    request: Request,
+    track_id: str,
+    _auth: bool = Depends(require_auth),
+    db: AsyncSession = Depends(get_db),
+):
     context = await build_detail_context(db, track_id)
     return render_template(request, "detail.html", context)
 
 
 @router.post("/delete/{track_id}")
-async def delete_track_route(request: Request, track_id: str, db: AsyncSession = Depends(get_db)):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
+async def delete_track_route(
+    request: Request,
+    track_id: str,
+    _auth: bool = Depends(require_auth),
+    db: AsyncSession = Depends(get_db),
+):
     await delete_track(db, track_id)
     return RedirectResponse(url="/", status_code=303)
 
 
 @router.post("/pin/{track_id}")
-async def toggle_pin(request: Request, track_id: str, db: AsyncSession = Depends(get_db)):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
+async def toggle_pin(
+    request: Request,
+    track_id: str,
+    _auth: bool = Depends(require_auth),
+    db: AsyncSession = Depends(get_db),
+):
     await toggle_track_pin(db, track_id)
     referer = request.headers.get("referer", "/")
     return RedirectResponse(url=referer, status_code=303)
@@ -103,23 +199,22 @@ async def update_notes(
     request: Request,
     track_id: str,
     notes: str = Form(""),
+    _auth: bool = Depends(require_auth),
     db: AsyncSession = Depends(get_db),
 ):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
     await update_track_notes(db, track_id, notes)
     return RedirectResponse(url=f"/detail/{track_id}", status_code=303)
 
 
 @router.get("/export")
-async def export_csv(request: Request, db: AsyncSession = Depends(get_db)):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
-    filename, csv_content = await export_tracks_csv(db)
+async def export_csv(
+    request: Request,
+    _auth: bool = Depends(require_auth),
+    db: AsyncSession = Depends(get_db),
+):
+    filename, csv_chunks = await export_tracks_csv(db)
     return StreamingResponse(
-        iter([csv_content]),
+        csv_chunks,
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -129,11 +224,9 @@ async def export_csv(request: Request, db: AsyncSession = Depends(get_db)):
 async def export_analytics(
     request: Request,
     date_range: str = "30",
+    _auth: bool = Depends(require_auth),
     db: AsyncSession = Depends(get_db),
 ):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
     filename, csv_content = await export_analytics_csv(db, date_range)
     return StreamingResponse(
         iter([csv_content]),
@@ -146,11 +239,9 @@ async def export_analytics(
 async def analytics(
     request: Request,
     date_range: str = "30",
+    _auth: bool = Depends(require_auth),
     db: AsyncSession = Depends(get_db),
 ):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
     context = await build_analytics_context(db, date_range)
     return render_template(request, "analytics.html", context)
 
@@ -162,11 +253,9 @@ async def recipients_list(
     sort: str = "score",
     order: str = "desc",
     page: int = 1,
+    _auth: bool = Depends(require_auth),
     db: AsyncSession = Depends(get_db),
 ):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
     context = await build_recipients_context(
         db,
         search=search,
@@ -181,10 +270,8 @@ async def recipients_list(
 async def recipient_detail(
     request: Request,
     email: str,
+    _auth: bool = Depends(require_auth),
     db: AsyncSession = Depends(get_db),
 ):
-    if not is_authenticated(request):
-        return redirect_to_login()
-
     context = await build_recipient_detail_context(db, email)
     return render_template(request, "recipient_detail.html", context)
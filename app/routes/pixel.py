@@ -1,48 +1,55 @@
-from fastapi import APIRouter, Request, Depends, BackgroundTasks
+from fastapi import APIRouter, Request, BackgroundTasks
 from fastapi.responses import Response
-from sqlalchemy.ext.asyncio import AsyncSession
-import base64
-import logging
 
-from ..database import get_db
-from ..services.tracking import record_pixel_open
-
-logger = logging.getLogger(__name__)
+from ..services.tracking import capture_pixel_client, record_pixel_open_in_background
 
 router = APIRouter()
 
-# 1x1 transparent GIF (43 bytes)
-PIXEL_GIF = base64.b64decode(
-    "R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
+# 1x1 transparent GIF (42 bytes)
+PIXEL_GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff"
+    b"!\xf9\x04\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x01D\x00;"
 )
 
+# Encoded once at import; every pixel response sends the same headers.
+_PIXEL_RAW_HEADERS = tuple(
+    Response(
+        content=PIXEL_GIF,
+        media_type="image/gif",
+        headers={
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "Pragma": "no-cache",
+            "Expires": "0"
+        },
+    ).raw_headers
+)
+
+
+class PixelResponse(Response):
+    """The tracking GIF, reusing the pre-encoded header list."""
+
+    media_type = "image/gif"
+
+    def __init__(self, background=None) -> None:
+        super().__init__(content=PIXEL_GIF, background=background)
+
+    def init_headers(self, headers=None) -> None:
+        self.raw_headers = list(_PIXEL_RAW_HEADERS)
+
+
 @router.get("/p/{tracking_id}.gif")
 async def track_pixel(
     tracking_id: str,
     request: Request,
     background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db)
 ):
     # Always return pixel regardless of whether tracking_id exists
-    # This prevents information leakage
-
-    try:
-        await record_pixel_open(db, tracking_id, request, background_tasks)
-    except Exception as e:
-        # Log the error but don't break pixel delivery
-        logger.exception(f"Failed to record open for tracking_id={tracking_id}: {e}")
-        try:
-            await db.rollback()
-        except Exception:
-            pass  # Rollback may fail if session is in a bad state
-
-    return Response(
-        content=PIXEL_GIF,
-        media_type="image/gif",
-        background=background_tasks,
-        headers={
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0"
-        }
+    # This prevents information leakage.
+    # The open is recorded after the GIF is sent, so clients never wait on the database.
+    background_tasks.add_task(
+        record_pixel_open_in_background,
+        tracking_id,
+        capture_pixel_client(request),
     )
+    return PixelResponse(background=background_tasks)
@@ -34,12 +34,13 @@ async def build_analytics_context(db: AsyncSession, date_range: str) -> dict:
     open_rate = _calculate_open_rate(tracks, real_opens)
 
     time_to_open_hours = _collect_time_to_open_hours(tracks, real_opens)
+    local_open_times = _collect_local_open_times(real_opens)
     avg_time_to_open = median(time_to_open_hours) if time_to_open_hours else None
 
     granularity = _get_granularity(date_range)
     time_series_labels, time_series_emails, time_series_opens = _build_time_series(
         tracks,
-        real_opens,
+        local_open_times,
         cutoff or datetime(2020, 1, 1, tzinfo=timezone.utc),
         now,
         granularity,
@@ -48,8 +49,8 @@ async def build_analytics_context(db: AsyncSession, date_range: str) -> dict:
     countries, cities = _build_geography(real_opens)
     top_countries = countries[:10]
     top_cities = cities[:10]
-    hour_labels, hour_data = _build_hour_distribution(real_opens)
-    dow_data = _build_day_of_week_distribution(real_opens)
+    hour_labels, hour_data = _build_hour_distribution(local_open_times)
+    dow_data = _build_day_of_week_distribution(local_open_times)
     time_bucket_labels, time_bucket_data = _build_time_to_open_buckets(time_to_open_hours)
 
     return {
@@ -105,14 +106,15 @@ async def export_analytics_csv(db: AsyncSession, date_range: str) -> tuple[str,
 
     writer.writerow(["=== Opens by Hour of Day ==="])
     writer.writerow(["Hour", "Opens"])
-    hour_labels, hour_data = _build_hour_distribution(real_opens)
+    local_open_times = _collect_local_open_times(real_opens)
+    hour_labels, hour_data = _build_hour_distribution(local_open_times)
     for label, count in zip(hour_labels, hour_data):
         writer.writerow([label, count])
     writer.writerow([])
 
     writer.writerow(["=== Opens by Day of Week ==="])
     writer.writerow(["Day", "Opens"])
-    dow_data = _build_day_of_week_distribution(real_opens)
+    dow_data = _build_day_of_week_distribution(local_open_times)
     for day_name, count in zip(DOW_NAMES, dow_data):
         writer.writerow([day_name, count])
 
@@ -197,9 +199,19 @@ def _get_granularity(date_range: str) -> str:
     return "monthly"
 
 
+def _collect_local_open_times(real_opens: list[RealOpenEvent]) -> list[datetime]:
+    # Convert each open to the display timezone once; the time series, hour and
+    # weekday breakdowns all bucket on the same local time.
+    return [
+        to_local(open_event.opened_at)
+        for open_event in real_opens
+        if open_event.opened_at is not None
+    ]
+
+
 def _build_time_series(
     tracks: list[TrackSnapshot],
-    real_opens: list[RealOpenEvent],
+    local_open_times: list[datetime],
     start: datetime,
     end: datetime,
     granularity: str,
@@ -209,11 +221,10 @@ def _build_time_series(
 
     for track in tracks:
         if track.created_at:
-            emails_by_date[_get_date_key(track.created_at, granularity)] += 1
+            emails_by_date[_get_date_key(to_local(track.created_at), granularity)] += 1
 
-    for open_event in real_opens:
-        if open_event.opened_at:
-            opens_by_date[_get_date_key(open_event.opened_at, granularity)] += 1
+    for local_dt in local_open_times:
+        opens_by_date[_get_date_key(local_dt, granularity)] += 1
 
     all_date_keys = _generate_date_keys(start, end, granularity)
     return (
@@ -223,11 +234,7 @@ def _build_time_series(
     )
 
 
-def _get_date_key(dt: datetime, granularity: str) -> str:
-    local_dt = to_local(dt)
-    if local_dt is None:
-        return ""
-
+def _get_date_key(local_dt: datetime, granularity: str) -> str:
     if granularity == "daily":
         return local_dt.strftime("%Y-%m-%d")
     if granularity == "weekly":
@@ -242,25 +249,27 @@ def _generate_date_keys(start: datetime, end: datetime, granularity: str) -> lis
     if start_local is None or end_local is None:
         return []
 
+    # Walk calendar dates rather than aware datetimes: the keys only need the
+    # local date, and a start time later in the day than `end` must not drop
+    # the final period.
+    current = start_local.date()
+    end_date = end_local.date()
     keys = []
-    current = start_local
 
     if granularity == "daily":
-        while current <= end_local:
-            keys.append(current.strftime("%Y-%m-%d"))
+        while current <= end_date:
+            keys.append(current.isoformat())
             current += timedelta(days=1)
     elif granularity == "weekly":
-        current = current - timedelta(days=current.weekday())
-        while current <= end_local:
-            keys.append(current.strftime("%Y-%m-%d"))
+        current -= timedelta(days=current.weekday())
+        while current <= end_date:
+            keys.append(current.isoformat())
             current += timedelta(weeks=1)
     else:
-        while current <= end_local:
-            keys.append(current.strftime("%Y-%m"))
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1, day=1)
-            else:
-                current = current.replace(month=current.month + 1, day=1)
+        year, month = current.year, current.month
+        while (year, month) <= (end_date.year, end_date.month):
+            keys.append(f"{year:04d}-{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
 
     return keys
 
@@ -282,24 +291,20 @@ def _build_geography(
     return sorted_countries, sorted_cities
 
 
-def _build_hour_distribution(real_opens: list[RealOpenEvent]) -> tuple[list[str], list[int]]:
+def _build_hour_distribution(local_open_times: list[datetime]) -> tuple[list[str], list[int]]:
     opens_by_hour = defaultdict(int)
-    for open_event in real_opens:
-        local_time = to_local(open_event.opened_at)
-        if local_time is not None:
-            opens_by_hour[local_time.hour] += 1
+    for local_time in local_open_times:
+        opens_by_hour[local_time.hour] += 1
 
     hour_labels = [f"{hour:02d}:00" for hour in range(24)]
     hour_data = [opens_by_hour.get(hour, 0) for hour in range(24)]
     return hour_labels, hour_data
 
 
-def _build_day_of_week_distribution(real_opens: list[RealOpenEvent]) -> list[int]:
+def _build_day_of_week_distribution(local_open_times: list[datetime]) -> list[int]:
     opens_by_dow = defaultdict(int)
-    for open_event in real_opens:
-        local_time = to_local(open_event.opened_at)
-        if local_time is not None:
-            opens_by_dow[local_time.weekday()] += 1
+    for local_time in local_open_times:
+        opens_by_dow[local_time.weekday()] += 1
     return [opens_by_dow.get(index, 0) for index in range(7)]
 
 
@@ -7,6 +7,7 @@ from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import Open, TrackedEmail
+from .dashboard_cache import invalidate_dashboard_cache
 from .open_activity import (
     RecentRealOpenRecord,
     TrackOpenRecord,
@@ -92,7 +93,7 @@ async def create_track(
     message_group_id: str | None,
 ) -> TrackedEmail:
     new_track = TrackedEmail(
-        id=str(uuid.uuid4()),
+        id=uuid.uuid4().hex,
         recipient=recipient,
         subject=subject,
         notes=notes,
@@ -102,6 +103,7 @@ async def create_track(
 
     db.add(new_track)
     await db.commit()
+    invalidate_dashboard_cache()
     await db.refresh(new_track)
     return new_track
 
@@ -120,9 +122,12 @@ async def list_track_opens(db: AsyncSession, track_id: str) -> list[TrackOpenRec
 
 
 async def delete_track(db: AsyncSession, track_id: str) -> None:
-    await _get_track_or_404(db, track_id)
-    await db.execute(delete(TrackedEmail).where(TrackedEmail.id == track_id))
+    # Opens are removed by the ON DELETE CASCADE foreign key.
+    result = await db.execute(delete(TrackedEmail).where(TrackedEmail.id == track_id))
     await db.commit()
+    invalidate_dashboard_cache()
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Track not found")
 
 
 def _build_latest_real_open_payload(
@@ -1,27 +1,49 @@
 import csv
 import io
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import AsyncIterator, Iterable, Iterator, Sequence
 from urllib.parse import quote
 
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import TrackedEmail
+from ..database import Open, TrackedEmail
 from ..time_utils import ensure_utc, to_local
 from ..urls import get_pixel_url
+from .dashboard_cache import (
+    invalidate_dashboard_cache,
+    lookup_dashboard_cache,
+    store_dashboard_cache,
+)
 from .open_activity import (
-    TrackOpenRecord,
     TrackOpenSummary,
     load_track_open_records,
-    load_track_open_records_map,
     load_track_open_summaries,
 )
 
 ITEMS_PER_PAGE = 25
 VALID_FILTERS = {"all", "opened", "unopened"}
 VALID_DATE_RANGES = {"all", "7", "30", "90"}
+GMAIL_SEARCH_URL_CACHE_SIZE = 1024
+EXPORT_BATCH_SIZE = 1000
+EXPORT_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S %Z"
+EXPORT_CSV_HEADER = (
+    "email_id",
+    "recipient",
+    "subject",
+    "email_created_at",
+    "opened_at",
+    "ip_address",
+    "country",
+    "city",
+    "user_agent",
+    "proxy_type",
+    "is_real_open",
+)
 
 
 @dataclass(frozen=True)
@@ -57,15 +79,21 @@ async def build_dashboard_context(
     page = max(page, 1)
 
     search = search.strip()
-    tracks = await _load_dashboard_track_snapshots(
-        db,
-        search=search,
-        date_range=date_range,
-    )
-    open_summaries = await load_track_open_summaries(
-        db,
-        track_ids=[track.id for track in tracks],
-    )
+    cache_key = ("dashboard", search, date_range)
+    cache_version, cached = lookup_dashboard_cache(cache_key)
+    if cached is None:
+        tracks = await _load_dashboard_track_snapshots(
+            db,
+            search=search,
+            date_range=date_range,
+        )
+        open_summaries = await load_track_open_summaries(
+            db,
+            track_ids=[track.id for track in tracks],
+        )
+        store_dashboard_cache(cache_key, cache_version, (tracks, open_summaries))
+    else:
+        tracks, open_summaries = cached
 
     groups: dict[str, list[dict]] = {}
     ungrouped: list[dict] = []
@@ -92,6 +120,8 @@ async def build_dashboard_context(
 
     start_idx = (page - 1) * ITEMS_PER_PAGE
     end_idx = start_idx + ITEMS_PER_PAGE
+    page_items = tracks_with_counts[start_idx:end_idx]
+    await _attach_page_notes(db, page_items)
 
     query_params = {}
     if filter_value != "all":
@@ -102,7 +132,7 @@ async def build_dashboard_context(
         query_params["date_range"] = date_range
 
     return {
-        "tracks": tracks_with_counts[start_idx:end_idx],
+        "tracks": page_items,
         "filter": filter_value,
         "search": search,
         "date_range": date_range,
@@ -134,63 +164,66 @@ async def build_detail_context(db: AsyncSession, track_id: str) -> dict:
         created_at=row[4],
     )
 
-    opens_asc = await load_track_open_records(db, track_id)
-    proxy_opens, real_opens = _partition_proxy_opens(opens_asc)
-
+    # Load newest first for display; the earliest proxy open is found by
+    # walking the same list backwards instead of keeping a second ordering.
+    opens = await load_track_open_records(db, track_id, order="desc")
+    real_open_count = sum(1 for open_event in opens if open_event.is_real_open)
     first_known_proxy = next(
         (
-            (open_event, proxy_type)
-            for open_event, proxy_type in proxy_opens
-            if proxy_type is not None
+            open_event
+            for open_event in reversed(opens)
+            if not open_event.is_real_open and open_event.proxy_type is not None
         ),
         None,
     )
-    first_proxy_open = first_known_proxy[0].opened_at if first_known_proxy else None
-    first_proxy_type = first_known_proxy[1] if first_known_proxy else None
-    opens = list(reversed(opens_asc))
+    first_proxy_open = first_known_proxy.opened_at if first_known_proxy else None
+    first_proxy_type = first_known_proxy.proxy_type if first_known_proxy else None
 
     pixel_url = get_pixel_url(track.id)
     html_snippet = f'<img src="{pixel_url}" width="1" height="1" style="display:none" alt="" />'
 
-    gmail_search_parts = ["in:sent"]
-    if track.recipient:
-        first_recipient = track.recipient.split(",")[0].strip()
-        gmail_search_parts.append(f"to:{first_recipient}")
-    if track.subject:
-        gmail_search_parts.append(f"subject:{track.subject}")
-    gmail_search_query = " ".join(gmail_search_parts)
-
     return {
         "track": track,
         "opens": opens,
-        "real_open_count": len(real_opens),
+        "real_open_count": real_open_count,
         "first_proxy_open": first_proxy_open,
         "first_proxy_type": first_proxy_type,
         "pixel_url": pixel_url,
         "html_snippet": html_snippet,
-        "gmail_search_url": f"https://mail.google.com/mail/u/0/#search/{quote(gmail_search_query)}",
+        "gmail_search_url": _build_gmail_search_url(track.recipient, track.subject),
     }
 
 
+@lru_cache(maxsize=GMAIL_SEARCH_URL_CACHE_SIZE)
+def _build_gmail_search_url(recipient: str | None, subject: str | None) -> str:
+    gmail_search_parts = ["in:sent"]
+    if recipient:
+        first_recipient = recipient.split(",")[0].strip()
+        gmail_search_parts.append(f"to:{first_recipient}")
+    if subject:
+        gmail_search_parts.append(f"subject:{subject}")
+    gmail_search_query = " ".join(gmail_search_parts)
+    return f"https://mail.google.com/mail/u/0/#search/{quote(gmail_search_query)}"
+
+
 async def delete_track(db: AsyncSession, track_id: str) -> None:
     await db.execute(delete(TrackedEmail).where(TrackedEmail.id == track_id))
     await db.commit()
+    invalidate_dashboard_cache()
 
 
 async def toggle_track_pin(db: AsyncSession, track_id: str) -> None:
+    # Flip in place so the primary-key lookup and the write are one statement.
     result = await db.execute(
-        select(TrackedEmail.pinned).where(TrackedEmail.id == track_id)
-    )
-    pinned = result.scalar_one_or_none()
-    if pinned is None:
-        return
-
-    await db.execute(
         update(TrackedEmail)
         .where(TrackedEmail.id == track_id)
-        .values(pinned=not bool(pinned))
+        .values(pinned=~TrackedEmail.pinned)
     )
+    if result.rowcount == 0:
+        return
+
     await db.commit()
+    invalidate_dashboard_cache()
 
 
 async def update_track_notes(db: AsyncSession, track_id: str, notes: str) -> None:
@@ -203,52 +236,91 @@ async def update_track_notes(db: AsyncSession, track_id: str, notes: str) -> Non
     await db.commit()
 
 
-async def export_tracks_csv(db: AsyncSession) -> tuple[str, str]:
-    tracks = await _load_dashboard_track_snapshots(db)
-    opens_by_track_id = await load_track_open_records_map(
-        db,
-        [track.id for track in tracks],
+async def export_tracks_csv(db: AsyncSession) -> tuple[str, AsyncIterator[str]]:
+    export_date = to_local(datetime.now(timezone.utc)).strftime("%Y-%m-%d")
+    return f"mailtrack_export_{export_date}.csv", _iter_tracks_csv(db)
+
+
+async def _iter_tracks_csv(db: AsyncSession) -> AsyncIterator[str]:
+    # Rows come off a server-side cursor and are yielded one fetch batch at a
+    # time, so neither the opens nor the rendered CSV are ever held in full.
+    # Formatting runs in the threadpool so a large export does not hold the
+    # event loop while other requests wait.
+    yield _write_csv_rows([EXPORT_CSV_HEADER])
+
+    result = await db.stream(
+        _build_export_rows_query().execution_options(yield_per=EXPORT_BATCH_SIZE)
     )
+    async for rows in result.partitions():
+        yield await run_in_threadpool(_write_csv_rows, _iter_export_csv_rows(rows))
+
 
+def _write_csv_rows(rows: Iterable[Sequence]) -> str:
     output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "email_id",
-        "recipient",
-        "subject",
-        "email_created_at",
-        "opened_at",
-        "ip_address",
-        "country",
-        "city",
-        "user_agent",
-        "proxy_type",
-        "is_real_open",
-    ])
+    csv.writer(output).writerows(rows)
+    return output.getvalue()
+
+
+def _iter_export_csv_rows(rows) -> Iterator[tuple]:
+    # Track columns repeat on every open row, so format them once per track.
+    track_columns: dict[str, tuple[str, str, str]] = {}
+    for (
+        track_id,
+        recipient,
+        subject,
+        created_at,
+        opened_at,
+        ip_address,
+        country,
+        city,
+        user_agent,
+        proxy_type,
+        is_real_open,
+    ) in rows:
+        columns = track_columns.get(track_id)
+        if columns is None:
+            columns = track_columns[track_id] = (
+                recipient or "",
+                subject or "",
+                to_local(created_at).strftime(EXPORT_TIMESTAMP_FORMAT) if created_at else "",
+            )
 
-    for track in tracks:
-        opens = opens_by_track_id.get(track.id, [])
-        email_created = to_local(track.created_at).strftime("%Y-%m-%d %H:%M:%S %Z") if track.created_at else ""
-
-        for open_event in opens:
-            opened_at = to_local(open_event.opened_at).strftime("%Y-%m-%d %H:%M:%S %Z") if open_event.opened_at else ""
-            writer.writerow([
-                track.id,
-                track.recipient or "",
-                track.subject or "",
-                email_created,
-                opened_at,
-                open_event.ip_address or "",
-                open_event.country or "",
-                open_event.city or "",
-                open_event.user_agent or "",
-                open_event.proxy_type or "",
-                "yes" if open_event.is_real_open else "no",
-            ])
-
-    output.seek(0)
-    export_date = to_local(datetime.now(timezone.utc)).strftime("%Y-%m-%d")
-    return f"mailtrack_export_{export_date}.csv", output.getvalue()
+        yield (
+            track_id,
+            *columns,
+            to_local(opened_at).strftime(EXPORT_TIMESTAMP_FORMAT) if opened_at else "",
+            ip_address or "",
+            country or "",
+            city or "",
+            user_agent or "",
+            proxy_type or "",
+            "yes" if is_real_open else "no",
+        )
+
+
+def _build_export_rows_query():
+    return (
+        select(
+            TrackedEmail.id,
+            TrackedEmail.recipient,
+            TrackedEmail.subject,
+            TrackedEmail.created_at,
+            Open.opened_at,
+            Open.ip_address,
+            Open.country,
+            Open.city,
+            Open.user_agent,
+            Open.proxy_type,
+            Open.is_real_open,
+        )
+        .join(Open, Open.tracked_email_id == TrackedEmail.id)
+        .order_by(
+            TrackedEmail.created_at.desc(),
+            TrackedEmail.id,
+            Open.opened_at.asc(),
+            Open.id.asc(),
+        )
+    )
 
 
 async def _load_dashboard_track_snapshots(
@@ -262,7 +334,6 @@ async def _load_dashboard_track_snapshots(
             TrackedEmail.id,
             TrackedEmail.recipient,
             TrackedEmail.subject,
-            TrackedEmail.notes,
             TrackedEmail.message_group_id,
             TrackedEmail.created_at,
             TrackedEmail.pinned,
@@ -289,28 +360,43 @@ async def _load_dashboard_track_snapshots(
             id=track_id,
             recipient=recipient,
             subject=subject,
-            notes=notes,
+            notes=None,
             message_group_id=message_group_id,
             created_at=created_at,
             pinned=bool(pinned),
         )
-        for track_id, recipient, subject, notes, message_group_id, created_at, pinned in result
+        for track_id, recipient, subject, message_group_id, created_at, pinned in result
     ]
 
 
-def _partition_proxy_opens(
-    opens: list[TrackOpenRecord],
-) -> tuple[list[tuple[TrackOpenRecord, str | None]], list[TrackOpenRecord]]:
-    proxy_opens: list[tuple[TrackOpenRecord, str | None]] = []
-    real_opens: list[TrackOpenRecord] = []
+async def _load_track_notes(db: AsyncSession, track_ids: list[str]) -> dict[str, str]:
+    if not track_ids:
+        return {}
 
-    for open_event in opens:
-        if not open_event.is_real_open:
-            proxy_opens.append((open_event, open_event.proxy_type))
-        else:
-            real_opens.append(open_event)
+    result = await db.execute(
+        select(TrackedEmail.id, TrackedEmail.notes).where(
+            TrackedEmail.id.in_(track_ids),
+            TrackedEmail.notes.isnot(None),
+        )
+    )
+    return {track_id: notes for track_id, notes in result}
 
-    return proxy_opens, real_opens
+
+async def _attach_page_notes(db: AsyncSession, page_items: list[dict]) -> None:
+    """Fill in notes only for the tracks the dashboard page actually renders."""
+    displayed_tracks = [
+        item["recipients"][0] if item["is_group"] else item
+        for item in page_items
+    ]
+    notes_by_track_id = await _load_track_notes(
+        db,
+        [track_data["track"].id for track_data in displayed_tracks],
+    )
+
+    for track_data in displayed_tracks:
+        notes = notes_by_track_id.get(track_data["track"].id)
+        if notes is not None:
+            track_data["track"] = replace(track_data["track"], notes=notes)
 
 
 def _build_track_summary(
@@ -320,6 +406,7 @@ def _build_track_summary(
     open_summary = open_summary or TrackOpenSummary()
 
     return {
+        "is_group": False,
         "track": track,
         "open_count": open_summary.open_count,
         "real_open_count": open_summary.real_open_count,
@@ -333,51 +420,55 @@ def _build_track_summary(
 
 def _build_grouped_dashboard_items(groups: dict[str, list[dict]], ungrouped: list[dict]) -> list[dict]:
     items = []
-    sorted_groups = sorted(
-        groups.items(),
-        key=lambda item: min(track_data["track"].created_at for track_data in item[1]),
-        reverse=True,
-    )
 
-    for group_id, group_tracks in sorted_groups:
-        group_tracks.sort(key=lambda track_data: track_data["track"].created_at)
-        proxy_tracks = [
-            (track_data["first_proxy_open"], track_data["first_proxy_type"])
-            for track_data in group_tracks
-            if track_data["first_proxy_open"]
-        ]
-        first_proxy = min(proxy_tracks, key=lambda item: item[0]) if proxy_tracks else (None, None)
-        items.append({
+    # Tracks arrive newest first from the listing query, so reversing each group
+    # puts its oldest send first without re-sorting. Ordering across items is
+    # left to the single _dashboard_sort_key pass in build_dashboard_context.
+    for group_id, group_tracks in groups.items():
+        group_tracks.reverse()
+        group_item = {
             "is_group": True,
             "group_id": group_id,
             "subject": group_tracks[0]["track"].subject,
             "created_at": group_tracks[0]["track"].created_at,
             "recipients": group_tracks,
-            "total_opens": sum(track_data["open_count"] for track_data in group_tracks),
-            "total_real_opens": sum(track_data["real_open_count"] for track_data in group_tracks),
-            "first_open": min(
-                (track_data["first_open"] for track_data in group_tracks if track_data["first_open"]),
-                default=None,
-            ),
-            "first_real_open": min(
-                (
-                    track_data["first_real_open"]
-                    for track_data in group_tracks
-                    if track_data["first_real_open"]
-                ),
-                default=None,
-            ),
-            "first_proxy_open": first_proxy[0],
-            "first_proxy_type": first_proxy[1],
-            "pinned": any(track_data["pinned"] for track_data in group_tracks),
-        })
-
-    for track_data in ungrouped:
-        items.append({"is_group": False, **track_data})
-
+            "total_opens": 0,
+            "total_real_opens": 0,
+            "first_open": None,
+            "first_real_open": None,
+            "first_proxy_open": None,
+            "first_proxy_type": None,
+            "pinned": False,
+        }
+        # One pass per group for the totals and running earliest timestamps.
+        for track_data in group_tracks:
+            group_item["total_opens"] += track_data["open_count"]
+            group_item["total_real_opens"] += track_data["real_open_count"]
+            group_item["first_open"] = _earliest(group_item["first_open"], track_data["first_open"])
+            group_item["first_real_open"] = _earliest(
+                group_item["first_real_open"],
+                track_data["first_real_open"],
+            )
+            first_proxy_open = track_data["first_proxy_open"]
+            if first_proxy_open and (
+                group_item["first_proxy_open"] is None
+                or first_proxy_open < group_item["first_proxy_open"]
+            ):
+                group_item["first_proxy_open"] = first_proxy_open
+                group_item["first_proxy_type"] = track_data["first_proxy_type"]
+            group_item["pinned"] = group_item["pinned"] or track_data["pinned"]
+        items.append(group_item)
+
+    items.extend(ungrouped)
     return items
 
 
+def _earliest(current: datetime | None, candidate: datetime | None) -> datetime | None:
+    if candidate and (current is None or candidate < current):
+        return candidate
+    return current
+
+
 def _dashboard_sort_key(item: dict) -> tuple[bool, float]:
     if item.get("is_group"):
         created_at = item.get("created_at")
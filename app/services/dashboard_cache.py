@@ -0,0 +1,45 @@
+"""In-process cache for the dashboard's track listing and recipient aggregates.
+
+Writers that change what the dashboard lists (new tracks, deletes, pins and
+recorded opens) call invalidate_dashboard_cache() after committing. Keys are
+tuples whose first element names the page that owns the entry. Readers
+capture the version before querying, so data loaded across a concurrent write
+is stored under the old version and never served.
+"""
+import time
+from typing import Hashable
+
+DASHBOARD_CACHE_SIZE = 32
+# Bounds staleness for date-range views, whose cutoff moves with the clock.
+DASHBOARD_CACHE_TTL_SECONDS = 60
+
+_version = 0
+_entries: dict[Hashable, tuple[int, float, object]] = {}
+
+
+def invalidate_dashboard_cache() -> None:
+    global _version
+    _version += 1
+    _entries.clear()
+
+
+def lookup_dashboard_cache(key: Hashable) -> tuple[int, object | None]:
+    """Return the current version and the cached value for key, if still fresh."""
+    version = _version
+    entry = _entries.get(key)
+    if entry is not None:
+        entry_version, stored_at, value = entry
+        if (
+            entry_version == version
+            and time.monotonic() - stored_at < DASHBOARD_CACHE_TTL_SECONDS
+        ):
+            return version, value
+    return version, None
+
+
+def store_dashboard_cache(key: Hashable, version: int, value: object) -> None:
+    if version != _version:
+        return
+    if key not in _entries and len(_entries) >= DASHBOARD_CACHE_SIZE:
+        _entries.clear()
+    _entries[key] = (version, time.monotonic(), value)
@@ -3,14 +3,13 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, update
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
-from ..database import TrackedEmail, async_session
+from ..database import Open, TrackedEmail, async_session
 from ..notifications import is_email_notifications_enabled, send_followup_reminder
 from ..time_utils import ensure_utc
-from .open_activity import load_real_open_summaries
 
 logger = logging.getLogger(__name__)
 FOLLOWUP_BATCH_SIZE = 200
@@ -31,35 +30,87 @@ async def check_followup_reminders() -> None:
 
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(days=settings.followup_days)
+    due_filters = (
+        TrackedEmail.created_at <= cutoff,
+        TrackedEmail.followup_notified_at.is_(None),
+    )
+    has_real_open = (
+        select(Open.id)
+        .where(
+            Open.tracked_email_id == TrackedEmail.id,
+            Open.is_real_open.is_(True),
+        )
+        .exists()
+    )
 
     async with async_session() as db:
-        result = await db.execute(
-            select(
-                TrackedEmail.id,
-                TrackedEmail.recipient,
-                TrackedEmail.subject,
-                TrackedEmail.created_at,
-            ).where(
-                TrackedEmail.created_at <= cutoff,
-                TrackedEmail.followup_notified_at.is_(None),
-            )
+        # Emails that were already opened never need a reminder; retire them in one statement.
+        await db.execute(
+            update(TrackedEmail)
+            .where(*due_filters, has_real_open)
+            .values(followup_notified_at=now)
         )
-        track_batch: list[FollowupTrackSnapshot] = []
-        for track_id, recipient, subject, created_at in result:
-            track_batch.append(
+        await db.commit()
+
+        # Page through candidates by (created_at, id) instead of buffering the whole backlog.
+        cursor_created_at: datetime | None = None
+        cursor_track_id: str | None = None
+        while True:
+            result = await db.execute(
+                _build_followup_candidate_query(
+                    due_filters=(*due_filters, ~has_real_open),
+                    cursor_created_at=cursor_created_at,
+                    cursor_track_id=cursor_track_id,
+                )
+            )
+            track_batch = [
                 FollowupTrackSnapshot(
                     id=track_id,
                     recipient=recipient,
                     subject=subject,
                     created_at=created_at,
                 )
-            )
-            if len(track_batch) >= FOLLOWUP_BATCH_SIZE:
-                await _process_followup_batch(db, track_batch, now)
-                track_batch = []
+                for track_id, recipient, subject, created_at in result
+            ]
+            if not track_batch:
+                break
 
-        if track_batch:
             await _process_followup_batch(db, track_batch, now)
+            if len(track_batch) < FOLLOWUP_BATCH_SIZE:
+                break
+
+            cursor_created_at = track_batch[-1].created_at
+            cursor_track_id = track_batch[-1].id
+
+
+def _build_followup_candidate_query(
+    *,
+    due_filters: tuple,
+    cursor_created_at: datetime | None = None,
+    cursor_track_id: str | None = None,
+):
+    query = (
+        select(
+            TrackedEmail.id,
+            TrackedEmail.recipient,
+            TrackedEmail.subject,
+            TrackedEmail.created_at,
+        )
+        .where(*due_filters)
+        .order_by(TrackedEmail.created_at.asc(), TrackedEmail.id.asc())
+        .limit(FOLLOWUP_BATCH_SIZE)
+    )
+    if cursor_created_at is not None and cursor_track_id is not None:
+        query = query.where(
+            or_(
+                TrackedEmail.created_at > cursor_created_at,
+                and_(
+                    TrackedEmail.created_at == cursor_created_at,
+                    TrackedEmail.id > cursor_track_id,
+                ),
+            )
+        )
+    return query
 
 
 async def _process_followup_batch(
@@ -67,41 +118,40 @@ async def _process_followup_batch(
     tracks: list[FollowupTrackSnapshot],
     now: datetime,
 ) -> None:
-    real_open_track_ids = set(
-        await load_real_open_summaries(db, track_ids=[track.id for track in tracks])
-    )
-
-    already_opened_track_ids = [track.id for track in tracks if track.id in real_open_track_ids]
-    if already_opened_track_ids:
-        await db.execute(
-            update(TrackedEmail)
-            .where(TrackedEmail.id.in_(already_opened_track_ids))
-            .values(followup_notified_at=now)
-        )
-        await db.commit()
-
-    for track in tracks:
-        if track.id in real_open_track_ids:
-            continue
-
-        created_at = ensure_utc(track.created_at)
-        if created_at is None:
-            continue
-
-        days_ago = (now - created_at).days
-        success = await asyncio.to_thread(
-            send_followup_reminder,
-            recipient=track.recipient,
-            subject=track.subject,
-            sent_at=created_at,
-            days_ago=days_ago,
-            track_id=track.id,
+    sent_track_ids: list[str] = []
+    try:
+        # Sends fan out concurrently; the notification SMTP pool bounds parallelism.
+        await asyncio.gather(
+            *(_send_followup_for_track(track, now, sent_track_ids) for track in tracks)
         )
-        if success:
+    finally:
+        # Record every reminder that went out, even if the batch was interrupted.
+        if sent_track_ids:
             await db.execute(
                 update(TrackedEmail)
-                .where(TrackedEmail.id == track.id)
+                .where(TrackedEmail.id.in_(sent_track_ids))
                 .values(followup_notified_at=now)
             )
             await db.commit()
-            logger.info("Follow-up reminder sent for track %s", track.id)
+
+
+async def _send_followup_for_track(
+    track: FollowupTrackSnapshot,
+    now: datetime,
+    sent_track_ids: list[str],
+) -> None:
+    created_at = ensure_utc(track.created_at)
+    if created_at is None:
+        return
+
+    days_ago = (now - created_at).days
+    success = await send_followup_reminder(
+        recipient=track.recipient,
+        subject=track.subject,
+        sent_at=created_at,
+        days_ago=days_ago,
+        track_id=track.id,
+    )
+    if success:
+        sent_track_ids.append(track.id)
+        logger.info("Follow-up reminder sent for track %s", track.id)
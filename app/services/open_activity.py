@@ -3,7 +3,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Literal
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import Open, TrackedEmail
@@ -16,14 +17,14 @@ RECENT_REAL_OPEN_LIMIT = 50
 RECENT_REAL_OPEN_BATCH_SIZE = 200
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrackOpenRecord(StoredOpenSnapshot):
     tracked_email_id: str
     id: int
     referer: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RealOpenEvent:
     tracked_email_id: str
     opened_at: datetime | None
@@ -31,7 +32,7 @@ class RealOpenEvent:
     city: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecentRealOpenRecord:
     id: int
     opened_at: datetime | None
@@ -129,17 +130,25 @@ async def load_track_open_summaries(
         _build_track_open_summary_query(track_ids=track_ids)
     )
 
-    summaries: dict[str, TrackOpenSummary] = {}
-    for tracked_email_id, opened_at, is_real_open, proxy_type in result:
-        summary = summaries.setdefault(tracked_email_id, TrackOpenSummary())
-        _accumulate_track_open_summary(
-            summary,
-            opened_at=ensure_utc(opened_at),
-            is_real_open=is_real_open,
-            proxy_type=proxy_type,
+    return {
+        tracked_email_id: TrackOpenSummary(
+            open_count=int(open_count or 0),
+            real_open_count=int(real_open_count or 0),
+            first_open=ensure_utc(first_open),
+            first_real_open=ensure_utc(first_real_open),
+            first_proxy_open=ensure_utc(first_proxy_open),
+            first_proxy_type=first_proxy_type,
         )
-
-    return summaries
+        for (
+            tracked_email_id,
+            open_count,
+            real_open_count,
+            first_open,
+            first_real_open,
+            first_proxy_open,
+            first_proxy_type,
+        ) in result
+    }
 
 
 async def load_real_open_events(
@@ -186,26 +195,18 @@ async def load_real_open_summaries(
     if track_ids == []:
         return {}
 
-    summaries: dict[str, TrackRealOpenSummary] = {}
-
     result = await db.execute(
-        _build_real_open_query(cutoff=cutoff, track_ids=track_ids)
+        _build_real_open_summary_query(cutoff=cutoff, track_ids=track_ids)
     )
 
-    for tracked_email_id, opened_at in result:
-        summary = summaries.setdefault(tracked_email_id, TrackRealOpenSummary())
-        summary.count += 1
-
-        opened_at = ensure_utc(opened_at)
-        if opened_at is None:
-            continue
-
-        if summary.first_open_at is None or opened_at < summary.first_open_at:
-            summary.first_open_at = opened_at
-        if summary.last_open_at is None or opened_at > summary.last_open_at:
-            summary.last_open_at = opened_at
-
-    return summaries
+    return {
+        tracked_email_id: TrackRealOpenSummary(
+            count=int(count or 0),
+            first_open_at=ensure_utc(first_open_at),
+            last_open_at=ensure_utc(last_open_at),
+        )
+        for tracked_email_id, count, first_open_at, last_open_at in result
+    }
 
 
 async def load_recent_real_open_records(
@@ -320,15 +321,40 @@ def _build_track_open_summary_query(
     *,
     track_ids: list[str],
 ):
+    is_real = Open.is_real_open.is_(True)
+    is_classified_proxy = and_(
+        Open.is_real_open.isnot(True),
+        Open.proxy_type.isnot(None),
+    )
+
+    # Earliest classified proxy open per track; resolved through the
+    # (tracked_email_id, is_real_open, opened_at) index for each group.
+    proxy_open = aliased(Open)
+    first_proxy_type = (
+        select(proxy_open.proxy_type)
+        .where(
+            proxy_open.tracked_email_id == Open.tracked_email_id,
+            proxy_open.is_real_open.isnot(True),
+            proxy_open.proxy_type.isnot(None),
+        )
+        .order_by(proxy_open.opened_at.asc(), proxy_open.id.asc())
+        .limit(1)
+        .correlate(Open)
+        .scalar_subquery()
+    )
+
     return (
         select(
             Open.tracked_email_id,
-            Open.opened_at,
-            Open.is_real_open,
-            Open.proxy_type,
+            func.count(Open.id),
+            func.sum(case((is_real, 1), else_=0)),
+            func.min(Open.opened_at),
+            func.min(case((is_real, Open.opened_at))),
+            func.min(case((is_classified_proxy, Open.opened_at))),
+            first_proxy_type,
         )
         .where(Open.tracked_email_id.in_(track_ids))
-        .order_by(*_build_track_open_order_by("asc"))
+        .group_by(Open.tracked_email_id)
     )
 
 
@@ -347,28 +373,6 @@ def _build_track_open_order_by(order: OpenSortOrder) -> tuple:
     )
 
 
-def _accumulate_track_open_summary(
-    summary: TrackOpenSummary,
-    *,
-    opened_at: datetime | None,
-    is_real_open: bool | None,
-    proxy_type: str | None,
-) -> None:
-    summary.open_count += 1
-    if summary.first_open is None:
-        summary.first_open = opened_at
-
-    if not is_real_open:
-        if summary.first_proxy_open is None and proxy_type is not None:
-            summary.first_proxy_open = opened_at
-            summary.first_proxy_type = proxy_type
-        return
-
-    summary.real_open_count += 1
-    if summary.first_real_open is None:
-        summary.first_real_open = opened_at
-
-
 def _build_real_open_query(
     *,
     cutoff: datetime | None = None,
@@ -390,6 +394,28 @@ def _build_real_open_query(
     return query
 
 
+def _build_real_open_summary_query(
+    *,
+    cutoff: datetime | None = None,
+    track_ids: list[str] | None = None,
+):
+    query = (
+        select(
+            Open.tracked_email_id,
+            func.count(),
+            func.min(Open.opened_at),
+            func.max(Open.opened_at),
+        )
+        .where(Open.is_real_open.is_(True))
+        .group_by(Open.tracked_email_id)
+    )
+    if cutoff is not None:
+        query = query.where(Open.opened_at >= cutoff)
+    if track_ids is not None:
+        query = query.where(Open.tracked_email_id.in_(track_ids))
+    return query
+
+
 def _build_recent_real_open_query(
     *,
     cutoff: datetime | None = None,
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import TrackedEmail
 from ..time_utils import ensure_utc, format_duration_hours, format_time_ago
+from .dashboard_cache import lookup_dashboard_cache, store_dashboard_cache
 from .open_activity import load_real_open_summaries
 
 ITEMS_PER_PAGE = 25
@@ -164,21 +165,28 @@ async def _load_recipient_list(
     search: str = "",
     now: datetime,
 ) -> list[dict]:
-    recipients: dict[str, dict] = {}
-    track_query = select(TrackedEmail.id, TrackedEmail.recipient)
-    if search:
-        track_query = track_query.where(TrackedEmail.recipient.ilike(f"%{search}%"))
-
-    track_result = await db.execute(track_query)
-    track_batch: list[RecipientTrackSnapshot] = []
-    for track_id, recipient in track_result:
-        track_batch.append(RecipientTrackSnapshot(id=track_id, recipient=recipient))
-        if len(track_batch) >= RECIPIENT_SUMMARY_BATCH_SIZE:
+    # The per-recipient counts only change when tracks or opens are written, so
+    # they are cached; scores depend on `now` and are recomputed every time.
+    cache_key = ("recipients", search)
+    cache_version, recipients = lookup_dashboard_cache(cache_key)
+    if recipients is None:
+        recipients = {}
+        track_query = select(TrackedEmail.id, TrackedEmail.recipient)
+        if search:
+            track_query = track_query.where(TrackedEmail.recipient.ilike(f"%{search}%"))
+
+        track_result = await db.execute(track_query)
+        track_batch: list[RecipientTrackSnapshot] = []
+        for track_id, recipient in track_result:
+            track_batch.append(RecipientTrackSnapshot(id=track_id, recipient=recipient))
+            if len(track_batch) >= RECIPIENT_SUMMARY_BATCH_SIZE:
+                await _accumulate_recipient_batch(db, track_batch, recipients)
+                track_batch = []
+
+        if track_batch:
             await _accumulate_recipient_batch(db, track_batch, recipients)
-            track_batch = []
 
-    if track_batch:
-        await _accumulate_recipient_batch(db, track_batch, recipients)
+        store_dashboard_cache(cache_key, cache_version, recipients)
 
     return _finalize_recipient_list(recipients, now)
 
@@ -4,12 +4,12 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
 from fastapi import BackgroundTasks, Request
-from sqlalchemy import select, update
+from sqlalchemy import case, func, select, update
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..client_ip import get_client_ip
-from ..database import Open, TrackedEmail
+from ..database import Open, TrackedEmail, async_session
 from ..geoip import lookup_ip
 from ..notifications import (
     is_email_notifications_enabled,
@@ -20,7 +20,7 @@ from ..notifications import (
 from ..time_utils import ensure_utc
 from ..open_classification import classify_open
 from ..proxy_detection import is_microsoft_hosted_ip
-from .open_activity import load_real_open_summaries
+from .dashboard_cache import invalidate_dashboard_cache
 
 logger = logging.getLogger(__name__)
 
@@ -40,15 +40,52 @@ class TrackingSnapshot:
     revived_notified_at: datetime | None
 
 
+@dataclass(frozen=True)
+class PixelClient:
+    ip_address: str
+    user_agent: str
+    referer: str
+
+
+def capture_pixel_client(request: Request) -> PixelClient:
+    """Copy what open recording needs off the request so it can run after the response."""
+    return PixelClient(
+        ip_address=get_client_ip(request) or (request.client.host if request.client else ""),
+        user_agent=request.headers.get("User-Agent", ""),
+        referer=request.headers.get("Referer", ""),
+    )
+
+
+async def record_pixel_open_in_background(tracking_id: str, client: PixelClient) -> None:
+    """Record an open with its own session once the pixel has been sent.
+
+    Notifications queued while recording run here too, after the commit.
+    """
+    background_tasks = BackgroundTasks()
+    async with async_session() as db:
+        try:
+            await record_pixel_open(db, tracking_id, client, background_tasks)
+        except Exception as e:
+            # Log the error; the pixel has already been delivered
+            logger.exception(f"Failed to record open for tracking_id={tracking_id}: {e}")
+            try:
+                await db.rollback()
+            except Exception:
+                pass  # Rollback may fail if session is in a bad state
+            return
+
+    await background_tasks()
+
+
 async def record_pixel_open(
     db: AsyncSession,
     tracking_id: str,
-    request: Request,
+    client: PixelClient,
     background_tasks: BackgroundTasks,
 ) -> None:
     for attempt in range(1, MAX_RECORD_PIXEL_OPEN_ATTEMPTS + 1):
         try:
-            await _record_pixel_open_once(db, tracking_id, request, background_tasks)
+            await _record_pixel_open_once(db, tracking_id, client, background_tasks)
             return
         except OperationalError as exc:
             if not _is_retryable_mysql_error(exc) or attempt == MAX_RECORD_PIXEL_OPEN_ATTEMPTS:
@@ -68,7 +105,7 @@ async def record_pixel_open(
 async def _record_pixel_open_once(
     db: AsyncSession,
     tracking_id: str,
-    request: Request,
+    client: PixelClient,
     background_tasks: BackgroundTasks,
 ) -> None:
     result = await db.execute(
@@ -103,9 +140,9 @@ async def _record_pixel_open_once(
     if (now - created_at).total_seconds() < MIN_OPEN_DELAY_SECONDS:
         return
 
-    ip_address = get_client_ip(request) or (request.client.host if request.client else "")
-    user_agent = request.headers.get("User-Agent", "")
-    referer = request.headers.get("Referer", "")
+    ip_address = client.ip_address
+    user_agent = client.user_agent
+    referer = client.referer
     is_real_open, proxy_type = classify_open(ip_address, user_agent)
     seconds_since_sent = (now - created_at).total_seconds()
     if _should_classify_as_microsoft_scanner(
@@ -151,17 +188,23 @@ async def _record_pixel_open_once(
     should_send_revived_conversation = False
     days_since_first_real_open = 0
 
-    if is_real_open and notifications_enabled:
+    if is_real_open and notifications_enabled and (
+        tracked_email.hot_notified_at is None
+        or tracked_email.revived_notified_at is None
+    ):
         await db.flush()
+        hot_open_count, first_real_open_at = await _load_real_open_activity(
+            db,
+            tracking_id,
+            now - timedelta(hours=24),
+        )
 
         if tracked_email.hot_notified_at is None:
-            hot_open_count = await _load_recent_real_open_count(db, tracking_id, now)
             if hot_open_count >= 3:
                 update_values["hot_notified_at"] = now
                 should_send_hot_conversation = True
 
         if tracked_email.revived_notified_at is None:
-            first_real_open_at = await _load_first_real_open_at(db, tracking_id)
             if first_real_open_at is not None:
                 days_since_first_real_open = (now - first_real_open_at).days
                 if days_since_first_real_open >= 14:
@@ -176,6 +219,7 @@ async def _record_pixel_open_once(
         )
 
     await db.commit()
+    invalidate_dashboard_cache()
 
     if should_notify:
         background_tasks.add_task(
@@ -250,27 +294,20 @@ def _should_classify_as_microsoft_scanner(
     )
 
 
-async def _load_recent_real_open_count(
+async def _load_real_open_activity(
     db: AsyncSession,
     tracking_id: str,
-    now: datetime,
-) -> int:
-    twenty_four_hours_ago = now - timedelta(hours=24)
-    real_open_summary = (
-        await load_real_open_summaries(
-            db,
-            cutoff=twenty_four_hours_ago,
-            track_ids=[tracking_id],
+    recent_since: datetime,
+) -> tuple[int, datetime | None]:
+    """Return the real-open count since recent_since and the first real open, in one query."""
+    result = await db.execute(
+        select(
+            func.count(case((Open.opened_at >= recent_since, 1))),
+            func.min(Open.opened_at),
+        ).where(
+            Open.tracked_email_id == tracking_id,
+            Open.is_real_open.is_(True),
         )
-    ).get(tracking_id)
-    return real_open_summary.count if real_open_summary else 0
-
-
-async def _load_first_real_open_at(
-    db: AsyncSession,
-    tracking_id: str,
-) -> datetime | None:
-    real_open_summary = (
-        await load_real_open_summaries(db, track_ids=[tracking_id])
-    ).get(tracking_id)
-    return real_open_summary.first_open_at if real_open_summary else None
+    )
+    recent_count, first_open_at = result.one()
+    return int(recent_count or 0), ensure_utc(first_open_at)
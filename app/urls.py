@@ -1,5 +1,8 @@
 from .config import settings
 
+# BASE_URL is fixed for the life of the process.
+_PIXEL_URL_PREFIX = f"{settings.base_url}/p/"
+
 
 def get_pixel_url(track_id: str) -> str:
-    return f"{settings.base_url}/p/{track_id}.gif"
+    return f"{_PIXEL_URL_PREFIX}{track_id}.gif"
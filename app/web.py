@@ -2,14 +2,33 @@ from typing import Any, Dict, Optional
 
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
 from .paths import TEMPLATES_DIR
 from .time_utils import to_local
 
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+# Templates ship with the app, so skip the per-render mtime check and keep
+# compiled bytecode on disk so restarted workers don't re-parse them.
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=select_autoescape(),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+)
 templates.env.globals["to_local"] = to_local
 
 
+def warm_templates() -> None:
+    """Compile the dashboard page templates so the first requests skip it."""
+    # Email templates share the directory but render through notifications' env.
+    for name in templates.env.list_templates(
+        filter_func=lambda name: "/" not in name and name.endswith(".html")
+    ):
+        templates.env.get_template(name)
+
+
 def render_template(
     request: Request,
     name: str,
@@ -88,6 +88,21 @@ class AnalyticsServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(["2026-03-02", "2026-03-09", "2026-03-16"], weekly_keys)
         self.assertEqual(["2025-11", "2025-12", "2026-01", "2026-02"], monthly_keys)
 
+    def test_generate_date_keys_includes_final_period_when_start_is_later_in_day(self) -> None:
+        daily_keys = analytics._generate_date_keys(
+            datetime(2026, 3, 1, 22, 0, tzinfo=timezone.utc),
+            datetime(2026, 3, 3, 13, 0, tzinfo=timezone.utc),
+            "daily",
+        )
+        monthly_keys = analytics._generate_date_keys(
+            datetime(2026, 1, 15, 22, 0, tzinfo=timezone.utc),
+            datetime(2026, 3, 1, 13, 0, tzinfo=timezone.utc),
+            "monthly",
+        )
+
+        self.assertEqual(["2026-03-01", "2026-03-02", "2026-03-03"], daily_keys)
+        self.assertEqual(["2026-01", "2026-02", "2026-03"], monthly_keys)
+
     def test_build_time_series_aligns_opens_and_emails_by_period(self) -> None:
         tracks = [
             TrackSnapshot(id="track-1", created_at=datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)),
@@ -100,7 +115,7 @@ class AnalyticsServiceTests(unittest.IsolatedAsyncioTestCase):
 
         labels, email_counts, open_counts = analytics._build_time_series(
             tracks,
-            real_opens,
+            analytics._collect_local_open_times(real_opens),
             datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc),
             datetime(2026, 3, 16, 12, 0, tzinfo=timezone.utc),
             "weekly",
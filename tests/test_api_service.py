@@ -9,7 +9,9 @@ os.environ.setdefault("BASE_URL", "https://example.com")
 os.environ.setdefault("DASHBOARD_USERNAME", "test-user")
 os.environ.setdefault("DASHBOARD_PASSWORD", "test-password")
 
-from app.services.api import create_track, get_stats
+from fastapi import HTTPException
+
+from app.services.api import create_track, delete_track, get_stats
 
 
 class ScalarResult:
@@ -32,6 +34,20 @@ class SequenceAsyncSession:
         return self.results.pop(0)
 
 
+class DeleteResult:
+    def __init__(self, rowcount: int) -> None:
+        self.rowcount = rowcount
+
+
+class DeleteTrackSession(SequenceAsyncSession):
+    def __init__(self, results) -> None:
+        super().__init__(results)
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
 class CreateTrackSession:
     def __init__(self) -> None:
         self.added = []
@@ -70,6 +86,25 @@ class ApiServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(timezone.utc, track.created_at.tzinfo)
         self.assertGreaterEqual(track.created_at, before)
         self.assertLessEqual(track.created_at, after)
+        self.assertRegex(track.id, r"^[0-9a-f]{32}$")
+
+    async def test_delete_track_issues_single_delete(self) -> None:
+        db = DeleteTrackSession([DeleteResult(1)])
+
+        await delete_track(db, "track-1")
+
+        self.assertEqual(1, len(db.queries))
+        self.assertIn("DELETE FROM tracked_emails", str(db.queries[0]))
+        self.assertEqual(1, db.commits)
+
+    async def test_delete_track_raises_404_when_nothing_was_deleted(self) -> None:
+        db = DeleteTrackSession([DeleteResult(0)])
+
+        with self.assertRaises(HTTPException) as raised:
+            await delete_track(db, "missing")
+
+        self.assertEqual(404, raised.exception.status_code)
+        self.assertEqual(1, len(db.queries))
 
     async def test_get_stats_includes_latest_real_open_metadata(self) -> None:
         opened_at = datetime(2026, 3, 27, 18, 0)
@@ -59,3 +59,39 @@ class ClientIpTests(unittest.TestCase):
             resolved_ip = client_ip.get_client_ip(request)
 
         self.assertEqual("198.51.100.20", resolved_ip)
+
+    def test_get_client_ip_skips_trusted_hops_and_ignores_spoofed_left_entries(self) -> None:
+        request = build_request(
+            peer_ip="10.0.0.2",
+            headers=[
+                (b"x-forwarded-for", b"203.0.113.99, 198.51.100.10 , 10.0.0.5, not-an-ip"),
+                (b"x-real-ip", b"203.0.113.7"),
+            ],
+        )
+
+        with patch.object(
+            client_ip,
+            "TRUSTED_PROXY_NETWORKS",
+            [ipaddress.ip_network("10.0.0.0/8")],
+        ):
+            resolved_ip = client_ip.get_client_ip(request)
+
+        self.assertEqual("198.51.100.10", resolved_ip)
+
+    def test_get_client_ip_falls_back_to_real_ip_when_chain_is_all_trusted(self) -> None:
+        request = build_request(
+            peer_ip="10.0.0.2",
+            headers=[
+                (b"x-forwarded-for", b"10.0.0.5"),
+                (b"x-real-ip", b"203.0.113.7"),
+            ],
+        )
+
+        with patch.object(
+            client_ip,
+            "TRUSTED_PROXY_NETWORKS",
+            [ipaddress.ip_network("10.0.0.0/8")],
+        ):
+            resolved_ip = client_ip.get_client_ip(request)
+
+        self.assertEqual("203.0.113.7", resolved_ip)
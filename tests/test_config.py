@@ -39,3 +39,26 @@ class ConfigTests(unittest.TestCase):
         with patch.dict(os.environ, env, clear=True):
             with self.assertRaisesRegex(RuntimeError, "Invalid DISPLAY_TIMEZONE"):
                 load_settings()
+
+    def test_load_settings_rejects_invalid_db_pool_size(self) -> None:
+        env = dict(BASE_ENV)
+        env["DB_POOL_SIZE"] = "0"
+
+        with patch.dict(os.environ, env, clear=True):
+            with self.assertRaisesRegex(RuntimeError, "Invalid DB_POOL_SIZE"):
+                load_settings()
+
+    def test_load_settings_enables_email_notifications_only_when_fully_configured(self) -> None:
+        env = dict(BASE_ENV)
+        env.update(
+            SMTP_USERNAME="mailer@example.com",
+            SMTP_PASSWORD="secret",
+            NOTIFICATION_EMAIL="alerts@example.com",
+        )
+
+        with patch.dict(os.environ, env, clear=True):
+            self.assertTrue(load_settings().email_notifications_enabled)
+
+        del env["SMTP_PASSWORD"]
+        with patch.dict(os.environ, env, clear=True):
+            self.assertFalse(load_settings().email_notifications_enabled)
@@ -5,16 +5,17 @@ from unittest.mock import AsyncMock, patch
 from fastapi import HTTPException
 
 from app.open_snapshot import build_open_snapshot
-from app.services import dashboard
+from app.services import dashboard, dashboard_cache
 from app.services.dashboard import DashboardTrackSnapshot, DetailTrackSnapshot
 from app.services.open_activity import TrackOpenRecord, TrackOpenSummary
 
 
 class FakeResult:
-    def __init__(self, *, row=None, scalar=None, rows=None) -> None:
+    def __init__(self, *, row=None, scalar=None, rows=None, rowcount=0) -> None:
         self.row = row
         self.scalar_value = scalar
         self.rows = rows or []
+        self.rowcount = rowcount
 
     def one_or_none(self):
         return self.row
@@ -26,6 +27,15 @@ class FakeResult:
         return iter(self.rows)
 
 
+class FakeStreamResult:
+    def __init__(self, partitions) -> None:
+        self.partition_rows = partitions
+
+    async def partitions(self):
+        for rows in self.partition_rows:
+            yield rows
+
+
 class FakeAsyncSession:
     def __init__(self, results) -> None:
         self.results = list(results)
@@ -38,6 +48,9 @@ class FakeAsyncSession:
             raise AssertionError("Unexpected execute() call")
         return self.results.pop(0)
 
+    async def stream(self, query):
+        return await self.execute(query)
+
     async def commit(self) -> None:
         self.commit_count += 1
 
@@ -72,17 +85,60 @@ def make_open_record(
 
 
 class DashboardServiceTests(unittest.IsolatedAsyncioTestCase):
-    async def test_build_dashboard_context_groups_tracks_and_sorts_pinned_first(self) -> None:
+    def setUp(self) -> None:
+        dashboard_cache.invalidate_dashboard_cache()
+        self.addCleanup(dashboard_cache.invalidate_dashboard_cache)
+
+    async def test_build_dashboard_context_reuses_cached_listing_until_invalidated(self) -> None:
         tracks = [
             DashboardTrackSnapshot(
                 id="track-1",
                 recipient="alice@example.com",
-                subject="Group subject",
+                subject="Hello",
                 notes=None,
-                message_group_id="group-1",
+                message_group_id=None,
                 created_at=datetime(2026, 3, 27, 10, 0, tzinfo=timezone.utc),
-                pinned=False,
             ),
+        ]
+        load_tracks = AsyncMock(return_value=tracks)
+        load_summaries = AsyncMock(return_value={})
+
+        async def build(search: str = ""):
+            return await dashboard.build_dashboard_context(
+                object(),
+                filter_value="all",
+                search=search,
+                date_range="all",
+                page=1,
+            )
+
+        with (
+            patch.object(dashboard, "_load_dashboard_track_snapshots", load_tracks),
+            patch.object(dashboard, "load_track_open_summaries", load_summaries),
+            patch.object(dashboard, "_load_track_notes", AsyncMock(return_value={})),
+        ):
+            first_context = await build()
+            cached_context = await build()
+            await build(search="alice")
+            dashboard_cache.invalidate_dashboard_cache()
+            refreshed_context = await build()
+
+        self.assertEqual(3, load_tracks.await_count)
+        self.assertEqual(3, load_summaries.await_count)
+        for context in (first_context, cached_context, refreshed_context):
+            self.assertEqual(["track-1"], [item["track"].id for item in context["tracks"]])
+
+    async def test_dashboard_cache_drops_values_loaded_across_a_write(self) -> None:
+        version, cached = dashboard_cache.lookup_dashboard_cache(("", "all"))
+        dashboard_cache.invalidate_dashboard_cache()
+        dashboard_cache.store_dashboard_cache(("", "all"), version, "stale")
+
+        self.assertIsNone(cached)
+        self.assertIsNone(dashboard_cache.lookup_dashboard_cache(("", "all"))[1])
+
+    async def test_build_dashboard_context_groups_tracks_and_sorts_pinned_first(self) -> None:
+        # Newest first, matching the listing query's ORDER BY.
+        tracks = [
             DashboardTrackSnapshot(
                 id="track-2",
                 recipient="bob@example.com",
@@ -92,19 +148,39 @@ class DashboardServiceTests(unittest.IsolatedAsyncioTestCase):
                 created_at=datetime(2026, 3, 27, 11, 0, tzinfo=timezone.utc),
                 pinned=False,
             ),
+            DashboardTrackSnapshot(
+                id="track-1",
+                recipient="alice@example.com",
+                subject="Group subject",
+                notes=None,
+                message_group_id="group-1",
+                created_at=datetime(2026, 3, 27, 10, 0, tzinfo=timezone.utc),
+                pinned=False,
+            ),
             DashboardTrackSnapshot(
                 id="track-3",
                 recipient="carol@example.com",
                 subject="Pinned single",
-                notes="follow up",
+                notes=None,
                 message_group_id=None,
                 created_at=datetime(2026, 3, 26, 12, 0, tzinfo=timezone.utc),
                 pinned=True,
             ),
         ]
         open_summaries = {
-            "track-1": TrackOpenSummary(open_count=2, real_open_count=1),
-            "track-2": TrackOpenSummary(open_count=0, real_open_count=0),
+            "track-1": TrackOpenSummary(
+                open_count=2,
+                real_open_count=1,
+                first_open=datetime(2026, 3, 27, 13, 0, tzinfo=timezone.utc),
+                first_proxy_open=datetime(2026, 3, 27, 13, 0, tzinfo=timezone.utc),
+                first_proxy_type="apple",
+            ),
+            "track-2": TrackOpenSummary(
+                open_count=0,
+                real_open_count=0,
+                first_proxy_open=datetime(2026, 3, 27, 12, 0, tzinfo=timezone.utc),
+                first_proxy_type="google",
+            ),
             "track-3": TrackOpenSummary(open_count=1, real_open_count=1),
         }
 
@@ -119,6 +195,11 @@ class DashboardServiceTests(unittest.IsolatedAsyncioTestCase):
                 "load_track_open_summaries",
                 AsyncMock(return_value=open_summaries),
             ),
+            patch.object(
+                dashboard,
+                "_load_track_notes",
+                AsyncMock(return_value={"track-3": "follow up"}),
+            ) as load_track_notes,
         ):
             context = await dashboard.build_dashboard_context(
                 object(),
@@ -134,9 +215,26 @@ class DashboardServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(1, context["page"])
         self.assertEqual(2, context["total_items"])
         self.assertEqual("track-3", context["tracks"][0]["track"].id)
+        self.assertEqual("follow up", context["tracks"][0]["track"].notes)
+        load_track_notes.assert_awaited_once()
+        self.assertEqual(["track-3", "track-1"], load_track_notes.await_args.args[1])
         self.assertTrue(context["tracks"][1]["is_group"])
+        self.assertEqual(
+            ["track-1", "track-2"],
+            [track_data["track"].id for track_data in context["tracks"][1]["recipients"]],
+        )
+        self.assertEqual(
+            datetime(2026, 3, 27, 10, 0, tzinfo=timezone.utc),
+            context["tracks"][1]["created_at"],
+        )
         self.assertEqual(2, context["tracks"][1]["total_opens"])
         self.assertEqual(1, context["tracks"][1]["total_real_opens"])
+        self.assertEqual(
+            datetime(2026, 3, 27, 13, 0, tzinfo=timezone.utc),
+            context["tracks"][1]["first_open"],
+        )
+        self.assertEqual("google", context["tracks"][1]["first_proxy_type"])
+        self.assertFalse(context["tracks"][1]["pinned"])
         self.assertEqual({"search": "alice"}, context["query_params"])
 
     async def test_build_dashboard_context_filters_opened_and_unopened_tracks(self) -> None:
@@ -166,6 +264,7 @@ class DashboardServiceTests(unittest.IsolatedAsyncioTestCase):
         with (
             patch.object(dashboard, "_load_dashboard_track_snapshots", AsyncMock(return_value=tracks)),
             patch.object(dashboard, "load_track_open_summaries", AsyncMock(return_value=open_summaries)),
+            patch.object(dashboard, "_load_track_notes", AsyncMock(return_value={})),
         ):
             opened_context = await dashboard.build_dashboard_context(
                 object(),
@@ -199,29 +298,39 @@ class DashboardServiceTests(unittest.IsolatedAsyncioTestCase):
                 ),
             ]
         )
-        opens_asc = [
+        opens_desc = [
             make_open_record(
                 tracked_email_id="track-1",
-                open_id=1,
-                opened_at=datetime(2026, 3, 21, 12, 0, tzinfo=timezone.utc),
-                is_real_open=False,
-                proxy_type="apple",
+                open_id=3,
+                opened_at=datetime(2026, 3, 22, 12, 0, tzinfo=timezone.utc),
+                is_real_open=True,
             ),
             make_open_record(
                 tracked_email_id="track-1",
                 open_id=2,
-                opened_at=datetime(2026, 3, 22, 12, 0, tzinfo=timezone.utc),
-                is_real_open=True,
+                opened_at=datetime(2026, 3, 21, 13, 0, tzinfo=timezone.utc),
+                is_real_open=False,
+                proxy_type="google",
+            ),
+            make_open_record(
+                tracked_email_id="track-1",
+                open_id=1,
+                opened_at=datetime(2026, 3, 21, 12, 0, tzinfo=timezone.utc),
+                is_real_open=False,
+                proxy_type="apple",
             ),
         ]
+        load_opens = AsyncMock(return_value=opens_desc)
 
-        with patch.object(dashboard, "load_track_open_records", AsyncMock(return_value=opens_asc)):
+        with patch.object(dashboard, "load_track_open_records", load_opens):
             context = await dashboard.build_detail_context(db, "track-1")
 
         self.assertEqual("track-1", context["track"].id)
         self.assertEqual(1, context["real_open_count"])
         self.assertEqual("apple", context["first_proxy_type"])
-        self.assertEqual([2, 1], [open_record.id for open_record in context["opens"]])
+        self.assertEqual(datetime(2026, 3, 21, 12, 0, tzinfo=timezone.utc), context["first_proxy_open"])
+        self.assertEqual([3, 2, 1], [open_record.id for open_record in context["opens"]])
+        load_opens.assert_awaited_once_with(db, "track-1", order="desc")
         self.assertIn("/p/track-1.gif", context["pixel_url"])
         self.assertIn("to%3Aalice%40example.com", context["gmail_search_url"])
         self.assertIn("subject%3AQuarterly%20Update", context["gmail_search_url"])
@@ -235,16 +344,19 @@ class DashboardServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(404, exc.exception.status_code)
 
     async def test_toggle_track_pin_updates_existing_track_and_skips_missing_track(self) -> None:
-        existing_db = FakeAsyncSession([FakeResult(scalar=False), FakeResult()])
-        missing_db = FakeAsyncSession([FakeResult(scalar=None)])
+        existing_db = FakeAsyncSession([FakeResult(rowcount=1)])
+        missing_db = FakeAsyncSession([FakeResult(rowcount=0)])
 
         await dashboard.toggle_track_pin(existing_db, "track-1")
         await dashboard.toggle_track_pin(missing_db, "missing")
 
         self.assertEqual(1, existing_db.commit_count)
         self.assertEqual(0, missing_db.commit_count)
-        self.assertEqual(2, len(existing_db.queries))
-        self.assertIn(True, existing_db.queries[1].compile().params.values())
+        self.assertEqual(1, len(existing_db.queries))
+        self.assertIn(
+            "SET pinned=NOT tracked_emails.pinned",
+            str(existing_db.queries[0]),
+        )
 
     async def test_update_track_notes_and_delete_track_commit_changes(self) -> None:
         db = FakeAsyncSession([FakeResult(), FakeResult()])
@@ -256,36 +368,65 @@ class DashboardServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn(None, db.queries[0].compile().params.values())
 
     async def test_export_tracks_csv_includes_real_open_flag_and_metadata(self) -> None:
-        tracks = [
-            DashboardTrackSnapshot(
-                id="track-1",
-                recipient="alice@example.com",
-                subject="Hello",
-                notes=None,
-                message_group_id=None,
-                created_at=datetime(2026, 3, 27, 12, 0, tzinfo=timezone.utc),
-                pinned=False,
-            ),
-        ]
-        opens_by_track_id = {
-            "track-1": [
-                make_open_record(
-                    tracked_email_id="track-1",
-                    open_id=1,
-                    opened_at=datetime(2026, 3, 27, 13, 0, tzinfo=timezone.utc),
-                    is_real_open=True,
-                )
-            ]
-        }
+        db = FakeAsyncSession([
+            FakeStreamResult([[
+                (
+                    "track-1",
+                    "alice@example.com",
+                    "Hello",
+                    datetime(2026, 3, 27, 12, 0, tzinfo=timezone.utc),
+                    datetime(2026, 3, 27, 13, 0),
+                    "8.8.8.8",
+                    "United States",
+                    "New York",
+                    "Mozilla/5.0",
+                    None,
+                    True,
+                ),
+            ]]),
+        ])
 
-        with (
-            patch.object(dashboard, "datetime", FrozenDateTime),
-            patch.object(dashboard, "_load_dashboard_track_snapshots", AsyncMock(return_value=tracks)),
-            patch.object(dashboard, "load_track_open_records_map", AsyncMock(return_value=opens_by_track_id)),
-        ):
-            filename, csv_content = await dashboard.export_tracks_csv(object())
+        with patch.object(dashboard, "datetime", FrozenDateTime):
+            filename, csv_chunks = await dashboard.export_tracks_csv(db)
+        csv_content = "".join([chunk async for chunk in csv_chunks])
 
         self.assertEqual("mailtrack_export_2026-03-27.csv", filename)
         self.assertIn("email_id,recipient,subject,email_created_at,opened_at,ip_address,country,city,user_agent,proxy_type,is_real_open", csv_content)
         self.assertIn("track-1,alice@example.com,Hello", csv_content)
         self.assertIn(",yes", csv_content)
+        self.assertEqual(
+            {"yield_per": dashboard.EXPORT_BATCH_SIZE},
+            db.queries[0].get_execution_options(),
+        )
+
+    async def test_export_tracks_csv_yields_one_chunk_per_fetch_batch(self) -> None:
+        def make_row(track_id: str, minute: int) -> tuple:
+            return (
+                track_id,
+                None,
+                None,
+                None,
+                datetime(2026, 3, 27, 13, minute, tzinfo=timezone.utc),
+                None,
+                None,
+                None,
+                None,
+                "apple",
+                False,
+            )
+
+        db = FakeAsyncSession([
+            FakeStreamResult([
+                [make_row("track-1", 1), make_row("track-1", 2)],
+                [make_row("track-3", 1), make_row("track-3", 2)],
+            ]),
+        ])
+
+        _filename, csv_chunks = await dashboard.export_tracks_csv(db)
+        chunks = [chunk async for chunk in csv_chunks]
+
+        self.assertEqual(3, len(chunks))
+        self.assertTrue(chunks[0].startswith("email_id,"))
+        self.assertEqual(2, chunks[1].count("track-1,"))
+        self.assertEqual(2, chunks[2].count("track-3,"))
+        self.assertIn(",apple,no", chunks[2])
@@ -129,9 +129,21 @@ class DatabaseTests(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(
             any("CREATE INDEX ix_tracked_emails_created_at" in sql for sql in conn.ddl_statements)
         )
+        self.assertTrue(
+            any(
+                "CREATE INDEX ix_tracked_emails_followup_notified_at_created_at" in sql
+                for sql in conn.ddl_statements
+            )
+        )
         self.assertFalse(
             any("CREATE INDEX ix_opens_opened_at_id" in sql for sql in conn.ddl_statements)
         )
+        self.assertTrue(
+            any(
+                "CREATE INDEX ix_opens_tracked_email_id_is_real_open_opened_at" in sql
+                for sql in conn.ddl_statements
+            )
+        )
         backfill.assert_awaited_once_with(conn)
 
     async def test_check_database_health_returns_true_when_queries_succeed(self) -> None:
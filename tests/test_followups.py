@@ -1,6 +1,6 @@
 import unittest
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services import followups
 
@@ -19,62 +19,90 @@ class FakeAsyncSession:
 
 
 class FollowupTests(unittest.IsolatedAsyncioTestCase):
-    async def test_process_followup_batch_marks_opened_tracks_and_only_sends_unopened_reminders(self) -> None:
+    async def test_process_followup_batch_sends_reminders_and_marks_sent_tracks_once(self) -> None:
         now = datetime(2026, 3, 27, 18, 0, tzinfo=timezone.utc)
-        opened_track = followups.FollowupTrackSnapshot(
-            id="track-opened",
-            recipient="opened@example.com",
-            subject="Already opened",
-            created_at=datetime(2026, 3, 20, 18, 0, tzinfo=timezone.utc),
+        undated_track = followups.FollowupTrackSnapshot(
+            id="track-undated",
+            recipient="undated@example.com",
+            subject="No timestamp",
+            created_at=None,
         )
-        unopened_track = followups.FollowupTrackSnapshot(
-            id="track-unopened",
-            recipient="pending@example.com",
-            subject="Needs follow-up",
-            created_at=datetime(2026, 3, 24, 12, 0, tzinfo=timezone.utc),
+        failed_track = followups.FollowupTrackSnapshot(
+            id="track-failed",
+            recipient="bounce@example.com",
+            subject="Send fails",
+            created_at=datetime(2026, 3, 23, 12, 0, tzinfo=timezone.utc),
         )
+        unopened_tracks = [
+            followups.FollowupTrackSnapshot(
+                id=f"track-unopened-{index}",
+                recipient="pending@example.com",
+                subject="Needs follow-up",
+                created_at=datetime(2026, 3, 24, 12, 0, tzinfo=timezone.utc),
+            )
+            for index in range(2)
+        ]
         db = FakeAsyncSession()
-        load_real_open_summaries = AsyncMock(
-            return_value={"track-opened": object()}
-        )
-        to_thread = AsyncMock(return_value=True)
+        send_followup_reminder = AsyncMock(side_effect=[False, True, True])
 
-        with (
-            patch.object(
-                followups,
-                "load_real_open_summaries",
-                load_real_open_summaries,
-            ),
-            patch.object(followups.asyncio, "to_thread", to_thread),
-        ):
+        with patch.object(followups, "send_followup_reminder", send_followup_reminder):
             await followups._process_followup_batch(
                 db,
-                [opened_track, unopened_track],
+                [undated_track, failed_track, *unopened_tracks],
                 now,
             )
 
-        load_real_open_summaries.assert_awaited_once_with(
-            db,
-            track_ids=["track-opened", "track-unopened"],
-        )
-        to_thread.assert_awaited_once_with(
-            followups.send_followup_reminder,
+        self.assertEqual(3, send_followup_reminder.await_count)
+        send_followup_reminder.assert_awaited_with(
             recipient="pending@example.com",
             subject="Needs follow-up",
-            sent_at=unopened_track.created_at,
+            sent_at=unopened_tracks[1].created_at,
             days_ago=3,
-            track_id="track-unopened",
+            track_id="track-unopened-1",
         )
-        self.assertEqual(2, db.commit_count)
+        self.assertEqual(1, db.commit_count)
+        self.assertEqual(1, len(db.queries))
+
+        update_params = db.queries[0].compile().params
+
+        self.assertIn(now, update_params.values())
+        self.assertIn(["track-unopened-0", "track-unopened-1"], update_params.values())
+
+    async def test_check_followup_reminders_retires_opened_tracks_in_sql(self) -> None:
+        db = FakeAsyncSession()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock(return_value=db)
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch.object(followups, "is_email_notifications_enabled", return_value=True),
+            patch.object(followups, "async_session", session_factory),
+        ):
+            await followups.check_followup_reminders()
+
         self.assertEqual(2, len(db.queries))
+        retire_sql = str(db.queries[0].compile())
+        candidate_sql = str(db.queries[1].compile())
+        self.assertTrue(retire_sql.startswith("UPDATE tracked_emails"))
+        self.assertIn("EXISTS", retire_sql)
+        self.assertIn("NOT (EXISTS", candidate_sql)
+        self.assertEqual(1, db.commit_count)
 
-        opened_update_params = db.queries[0].compile().params
-        unopened_update_params = db.queries[1].compile().params
+    def test_build_followup_candidate_query_pages_by_created_at_and_id(self) -> None:
+        cursor_created_at = datetime(2026, 3, 20, 18, 0, tzinfo=timezone.utc)
+        query = followups._build_followup_candidate_query(
+            due_filters=(followups.TrackedEmail.followup_notified_at.is_(None),),
+            cursor_created_at=cursor_created_at,
+            cursor_track_id="track-9",
+        )
 
-        self.assertIn(now, opened_update_params.values())
-        self.assertIn(["track-opened"], opened_update_params.values())
-        self.assertIn(now, unopened_update_params.values())
-        self.assertIn("track-unopened", unopened_update_params.values())
+        compiled = query.compile()
+        sql = str(compiled)
+        self.assertIn("ORDER BY tracked_emails.created_at ASC, tracked_emails.id ASC", sql)
+        self.assertIn("tracked_emails.created_at > ", sql)
+        self.assertIn("tracked_emails.id > ", sql)
+        self.assertIn(followups.FOLLOWUP_BATCH_SIZE, compiled.params.values())
+        self.assertIn("track-9", compiled.params.values())
 
 
 if __name__ == "__main__":
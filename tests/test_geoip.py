@@ -24,10 +24,22 @@ class FakeResponse:
     def __init__(self, content: bytes) -> None:
         self.content = content
         self.status_checked = False
+        self.chunk_sizes = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
 
     def raise_for_status(self) -> None:
         self.status_checked = True
 
+    async def aiter_bytes(self, chunk_size: int):
+        self.chunk_sizes.append(chunk_size)
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
 
 class FakeAsyncClient:
     def __init__(self, response: FakeResponse) -> None:
@@ -40,12 +52,16 @@ class FakeAsyncClient:
     async def __aexit__(self, exc_type, exc, tb):
         return False
 
-    async def get(self, url: str):
-        self.requested_urls.append(url)
+    def stream(self, method: str, url: str):
+        self.requested_urls.append((method, url))
         return self.response
 
 
 class GeoIpTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        geoip._lookup_cached.cache_clear()
+        self.addCleanup(geoip._lookup_cached.cache_clear)
+
     async def test_download_database_returns_false_without_license_key(self) -> None:
         with patch.object(geoip, "settings", SimpleNamespace(maxmind_license_key="")):
             downloaded = await geoip.download_database()
@@ -69,16 +85,22 @@ class GeoIpTests(unittest.IsolatedAsyncioTestCase):
             ):
                 downloaded = await geoip.download_database()
                 extracted_bytes = db_path.read_bytes()
+                archive_left_behind = (geoip_dir / "GeoLite2-City.tar.gz").exists()
 
         self.assertTrue(downloaded)
         self.assertEqual(
             [
-                "https://download.maxmind.com/app/geoip_download?"
-                "edition_id=GeoLite2-City&license_key=license-key&suffix=tar.gz"
+                (
+                    "GET",
+                    "https://download.maxmind.com/app/geoip_download?"
+                    "edition_id=GeoLite2-City&license_key=license-key&suffix=tar.gz",
+                )
             ],
             fake_client.requested_urls,
         )
         self.assertTrue(response.status_checked)
+        self.assertEqual([geoip.DOWNLOAD_CHUNK_SIZE], response.chunk_sizes)
+        self.assertFalse(archive_left_behind)
         self.assertEqual(b"mmdb-data", extracted_bytes)
 
     async def test_download_database_returns_false_when_archive_has_no_mmdb(self) -> None:
@@ -115,7 +137,33 @@ class GeoIpTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertIs(fake_reader, first_reader)
         self.assertIs(fake_reader, second_reader)
-        reader_cls.assert_called_once_with(str(db_path))
+        reader_cls.assert_called_once_with(
+            str(db_path),
+            mode=geoip.geoip2.database.MODE_MMAP_EXT,
+        )
+
+    def test_get_reader_falls_back_when_c_extension_is_unavailable(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "GeoLite2-City.mmdb"
+            db_path.write_bytes(b"db")
+            fake_reader = object()
+
+            with (
+                patch.object(geoip, "DB_PATH", db_path),
+                patch.object(geoip, "_reader", None),
+                patch.object(
+                    geoip.geoip2.database,
+                    "Reader",
+                    side_effect=[ValueError("no extension"), fake_reader],
+                ) as reader_cls,
+                self.assertLogs(geoip.logger, "WARNING"),
+            ):
+                reader = geoip.get_reader()
+
+        self.assertIs(fake_reader, reader)
+        self.assertEqual(2, reader_cls.call_count)
+        self.assertEqual((str(db_path),), reader_cls.call_args.args)
+        self.assertEqual({}, reader_cls.call_args.kwargs)
 
     def test_lookup_ip_handles_private_not_found_and_successful_results(self) -> None:
         class FakeReader:
@@ -123,6 +171,7 @@ class GeoIpTests(unittest.IsolatedAsyncioTestCase):
                 self.calls = []
 
             def city(self, ip_address: str):
+                ip_address = str(ip_address)
                 self.calls.append(ip_address)
                 if ip_address == "8.8.4.4":
                     return SimpleNamespace(
@@ -137,12 +186,55 @@ class GeoIpTests(unittest.IsolatedAsyncioTestCase):
 
         with patch.object(geoip, "get_reader", return_value=reader):
             self.assertEqual((None, None), geoip.lookup_ip("10.0.0.1"))
+            self.assertEqual((None, None), geoip.lookup_ip("172.31.255.1"))
+            self.assertEqual((None, None), geoip.lookup_ip("fd00::1"))
+            self.assertEqual((None, None), geoip.lookup_ip("not-an-ip"))
+            self.assertEqual((None, None), geoip.lookup_ip(""))
             self.assertEqual((None, None), geoip.lookup_ip("1.1.1.1"))
             self.assertEqual(("United States", "Mountain View"), geoip.lookup_ip("8.8.4.4"))
             self.assertEqual((None, None), geoip.lookup_ip("8.8.8.8"))
 
         self.assertEqual(["1.1.1.1", "8.8.4.4", "8.8.8.8"], reader.calls)
 
+    def test_lookup_ip_does_not_treat_public_lookalike_prefixes_as_private(self) -> None:
+        reader = SimpleNamespace(
+            city=lambda ip_address: SimpleNamespace(
+                country=SimpleNamespace(name="United States"),
+                city=SimpleNamespace(name=str(ip_address)),
+            )
+        )
+
+        with patch.object(geoip, "get_reader", return_value=reader):
+            self.assertEqual(("United States", "172.160.0.1"), geoip.lookup_ip("172.160.0.1"))
+            self.assertEqual(("United States", "fc::1"), geoip.lookup_ip("fc::1"))
+
+    def test_lookup_ip_caches_resolved_locations_but_not_reader_errors(self) -> None:
+        class FakeReader:
+            def __init__(self) -> None:
+                self.calls = []
+                self.fail = True
+
+            def city(self, ip_address: str):
+                ip_address = str(ip_address)
+                self.calls.append(ip_address)
+                if ip_address == "9.9.9.9" and self.fail:
+                    self.fail = False
+                    raise RuntimeError("transient")
+                return SimpleNamespace(
+                    country=SimpleNamespace(name="United States"),
+                    city=SimpleNamespace(name="Berkeley"),
+                )
+
+        reader = FakeReader()
+
+        with patch.object(geoip, "get_reader", return_value=reader):
+            self.assertEqual(("United States", "Berkeley"), geoip.lookup_ip("8.8.4.4"))
+            self.assertEqual(("United States", "Berkeley"), geoip.lookup_ip("8.8.4.4"))
+            self.assertEqual((None, None), geoip.lookup_ip("9.9.9.9"))
+            self.assertEqual(("United States", "Berkeley"), geoip.lookup_ip("9.9.9.9"))
+
+        self.assertEqual(["8.8.4.4", "9.9.9.9", "9.9.9.9"], reader.calls)
+
     async def test_init_geoip_downloads_when_missing_and_reports_status(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             missing_db_path = Path(tmpdir) / "missing.mmdb"
@@ -151,12 +243,12 @@ class GeoIpTests(unittest.IsolatedAsyncioTestCase):
                 patch.object(geoip, "DB_PATH", missing_db_path),
                 patch.object(geoip, "download_database", AsyncMock()) as download_database,
                 patch.object(geoip, "get_reader", return_value=object()),
-                patch("builtins.print") as fake_print,
+                self.assertLogs(geoip.logger, "INFO") as logs,
             ):
                 await geoip.init_geoip()
 
         download_database.assert_awaited_once()
-        fake_print.assert_any_call("GeoIP database ready")
+        self.assertIn("GeoIP database ready", logs.output[-1])
 
     async def test_init_geoip_reports_when_database_is_unavailable(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -167,9 +259,9 @@ class GeoIpTests(unittest.IsolatedAsyncioTestCase):
                 patch.object(geoip, "DB_PATH", db_path),
                 patch.object(geoip, "download_database", AsyncMock()) as download_database,
                 patch.object(geoip, "get_reader", return_value=None),
-                patch("builtins.print") as fake_print,
+                self.assertLogs(geoip.logger, "WARNING") as logs,
             ):
                 await geoip.init_geoip()
 
         download_database.assert_not_awaited()
-        fake_print.assert_any_call("GeoIP database not available")
+        self.assertIn("GeoIP database not available", logs.output[-1])
@@ -2,6 +2,8 @@ import asyncio
 import unittest
 from unittest.mock import AsyncMock, patch
 
+import httpx
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from app import main
@@ -74,3 +76,26 @@ class MainTests(unittest.IsolatedAsyncioTestCase):
             response = await main.health_check()
 
         self.assertEqual({"status": "ok", "database": "ok"}, response)
+
+    async def test_session_middleware_skips_pixel_and_api_paths(self) -> None:
+        app = FastAPI()
+        app.add_middleware(main.DashboardSessionMiddleware, secret_key="test-secret")
+
+        @app.get("/p/{tracking_id}.gif")
+        async def pixel(request: Request):
+            return {"has_session": "session" in request.scope}
+
+        @app.get("/login")
+        async def login(request: Request):
+            request.session["visited"] = True
+            return {"has_session": "session" in request.scope}
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            pixel_response = await client.get("/p/track-1.gif")
+            login_response = await client.get("/login")
+
+        self.assertEqual({"has_session": False}, pixel_response.json())
+        self.assertNotIn("set-cookie", pixel_response.headers)
+        self.assertEqual({"has_session": True}, login_response.json())
+        self.assertIn("session=", login_response.headers["set-cookie"])
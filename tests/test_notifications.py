@@ -1,11 +1,13 @@
-import smtplib
+import asyncio
 import unittest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from email import message_from_string
 from email.header import decode_header
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import aiosmtplib
+
 from app import notifications
 
 
@@ -21,30 +23,60 @@ def decode_subject(raw_message: str) -> str:
 
 
 class FakeSMTP:
-    def __init__(self, host, port) -> None:
-        self.host = host
+    def __init__(self, hostname, port) -> None:
+        self.hostname = hostname
         self.port = port
-        self.started_tls = False
+        self.start_tls = None
+        self.connected = False
         self.logged_in = None
         self.sent = None
+        self.send_count = 0
+        self.closed = False
 
-    def __enter__(self):
-        return self
+    async def connect(self) -> None:
+        self.connected = True
 
-    def __exit__(self, exc_type, exc, tb):
-        return False
+    async def login(self, username: str, password: str) -> None:
+        self.logged_in = (username, password)
 
-    def starttls(self) -> None:
-        self.started_tls = True
+    async def sendmail(self, sender: str, recipients: str, message: str) -> None:
+        self.sent = (sender, recipients, message)
+        self.send_count += 1
 
-    def login(self, username: str, password: str) -> None:
-        self.logged_in = (username, password)
+    async def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class DisconnectedSMTP(FakeSMTP):
+    async def sendmail(self, sender: str, recipients: str, message: str) -> None:
+        raise aiosmtplib.SMTPServerDisconnected("idle timeout")
 
-    def sendmail(self, sender: str, recipient: str, message: str) -> None:
-        self.sent = (sender, recipient, message)
 
+def fake_smtp_factory(fake_smtp: FakeSMTP):
+    def build(*, hostname, port, start_tls):
+        fake_smtp.hostname = hostname
+        fake_smtp.port = port
+        fake_smtp.start_tls = start_tls
+        return fake_smtp
+
+    return build
+
+
+class NotificationsTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        notifications._idle_smtp.clear()
+        self.addCleanup(notifications._idle_smtp.clear)
+        slots_patch = patch.object(
+            notifications,
+            "_smtp_slots",
+            asyncio.Semaphore(notifications.SMTP_POOL_SIZE),
+        )
+        slots_patch.start()
+        self.addCleanup(slots_patch.stop)
 
-class NotificationsTests(unittest.TestCase):
     def _build_settings(self, **overrides):
         base = {
             "smtp_server": "smtp.example.com",
@@ -54,6 +86,10 @@ class NotificationsTests(unittest.TestCase):
             "notification_email": "alerts@example.com",
         }
         base.update(overrides)
+        base.setdefault(
+            "email_notifications_enabled",
+            bool(base["smtp_username"] and base["smtp_password"] and base["notification_email"]),
+        )
         return SimpleNamespace(**base)
 
     def test_format_time_elapsed_handles_negative_and_compound_durations(self) -> None:
@@ -78,22 +114,60 @@ class NotificationsTests(unittest.TestCase):
             ),
         )
 
-    def test_is_email_notifications_enabled_requires_all_fields(self) -> None:
+    def test_format_time_elapsed_shows_largest_unit_and_adjacent_unit_only(self) -> None:
+        sent_at = datetime(2026, 3, 27, 17, 0, tzinfo=timezone.utc)
+        cases = {
+            0: "immediately",
+            1: "1 second",
+            59: "59 seconds",
+            61: "1 minute, 1 second",
+            3605: "1 hour",
+            86400 + 300: "1 day",
+            2 * 86400 + 2 * 3600 + 59: "2 days, 2 hours",
+        }
+
+        for seconds, expected in cases.items():
+            with self.subTest(seconds=seconds):
+                self.assertEqual(
+                    expected,
+                    notifications.format_time_elapsed(
+                        sent_at,
+                        sent_at + timedelta(seconds=seconds),
+                    ),
+                )
+
+    def test_format_notification_time_matches_strftime(self) -> None:
+        for dt in (
+            datetime(2026, 1, 5, 0, 7, tzinfo=timezone.utc),
+            datetime(2026, 3, 27, 12, 0, tzinfo=timezone.utc),
+            datetime(2026, 12, 31, 23, 59, tzinfo=timezone.utc),
+        ):
+            with self.subTest(dt=dt):
+                self.assertEqual(
+                    dt.strftime("%B %d, %Y at %I:%M %p"),
+                    notifications.format_notification_time(dt),
+                )
+
+    def test_is_email_notifications_enabled_reflects_loaded_settings(self) -> None:
         with patch.object(notifications, "settings", self._build_settings()):
             self.assertTrue(notifications.is_email_notifications_enabled())
 
         with patch.object(notifications, "settings", self._build_settings(notification_email="")):
             self.assertFalse(notifications.is_email_notifications_enabled())
 
-    def test_send_open_notification_returns_true_when_smtp_succeeds(self) -> None:
+    async def test_send_open_notification_returns_true_when_smtp_succeeds(self) -> None:
         fake_smtp = FakeSMTP("smtp.example.com", 587)
 
         with (
             patch.object(notifications, "settings", self._build_settings()),
             patch.object(notifications, "is_email_notifications_enabled", return_value=True),
-            patch.object(notifications.smtplib, "SMTP", return_value=fake_smtp),
+            patch.object(
+                notifications.aiosmtplib,
+                "SMTP",
+                side_effect=fake_smtp_factory(fake_smtp),
+            ),
         ):
-            sent = notifications.send_open_notification(
+            sent = await notifications.send_open_notification(
                 recipient="alice@example.com",
                 subject="Hello",
                 opened_at=datetime(2026, 3, 27, 18, 0, tzinfo=timezone.utc),
@@ -104,24 +178,57 @@ class NotificationsTests(unittest.TestCase):
             )
 
         self.assertTrue(sent)
-        self.assertTrue(fake_smtp.started_tls)
+        self.assertTrue(fake_smtp.start_tls)
+        self.assertTrue(fake_smtp.connected)
         self.assertEqual(("mailer@example.com", "secret"), fake_smtp.logged_in)
         self.assertIn(
             "Subject: alice read your message 1 hour after you sent it",
             fake_smtp.sent[2],
         )
 
-    def test_send_open_notification_returns_false_when_smtp_fails(self) -> None:
+    async def test_send_open_notification_escapes_user_values_in_html_body(self) -> None:
+        fake_smtp = FakeSMTP("smtp.example.com", 587)
+
         with (
             patch.object(notifications, "settings", self._build_settings()),
             patch.object(notifications, "is_email_notifications_enabled", return_value=True),
             patch.object(
-                notifications.smtplib,
+                notifications.aiosmtplib,
                 "SMTP",
-                side_effect=smtplib.SMTPException("boom"),
+                side_effect=fake_smtp_factory(fake_smtp),
             ),
         ):
-            sent = notifications.send_open_notification(
+            sent = await notifications.send_open_notification(
+                recipient="alice@example.com",
+                subject="<script>alert(1)</script>",
+                opened_at=datetime(2026, 3, 27, 18, 0, tzinfo=timezone.utc),
+                country="United States",
+                city="New York",
+                track_id="track-1",
+            )
+
+        self.assertTrue(sent)
+        html_part, = [
+            part
+            for part in message_from_string(fake_smtp.sent[2]).walk()
+            if part.get_content_type() == "text/html"
+        ]
+        html_body = html_part.get_payload(decode=True).decode()
+        self.assertIn("&lt;script&gt;alert(1)&lt;/script&gt;", html_body)
+        self.assertNotIn("<script>", html_body)
+        self.assertIn("New York, United States", html_body)
+
+    async def test_send_open_notification_returns_false_when_smtp_fails(self) -> None:
+        with (
+            patch.object(notifications, "settings", self._build_settings()),
+            patch.object(notifications, "is_email_notifications_enabled", return_value=True),
+            patch.object(
+                notifications.aiosmtplib,
+                "SMTP",
+                side_effect=aiosmtplib.SMTPException("boom"),
+            ),
+        ):
+            sent = await notifications.send_open_notification(
                 recipient="alice@example.com",
                 subject="Hello",
                 opened_at=datetime(2026, 3, 27, 18, 0, tzinfo=timezone.utc),
@@ -133,9 +240,9 @@ class NotificationsTests(unittest.TestCase):
 
         self.assertFalse(sent)
 
-    def test_send_followup_reminder_returns_false_when_disabled(self) -> None:
+    async def test_send_followup_reminder_returns_false_when_disabled(self) -> None:
         with patch.object(notifications, "is_email_notifications_enabled", return_value=False):
-            sent = notifications.send_followup_reminder(
+            sent = await notifications.send_followup_reminder(
                 recipient="alice@example.com",
                 subject="Hello",
                 sent_at=datetime(2026, 3, 27, 17, 0, tzinfo=timezone.utc),
@@ -145,15 +252,19 @@ class NotificationsTests(unittest.TestCase):
 
         self.assertFalse(sent)
 
-    def test_send_followup_reminder_succeeds(self) -> None:
+    async def test_send_followup_reminder_succeeds(self) -> None:
         fake_smtp = FakeSMTP("smtp.example.com", 587)
 
         with (
             patch.object(notifications, "settings", self._build_settings()),
             patch.object(notifications, "is_email_notifications_enabled", return_value=True),
-            patch.object(notifications.smtplib, "SMTP", return_value=fake_smtp),
+            patch.object(
+                notifications.aiosmtplib,
+                "SMTP",
+                side_effect=fake_smtp_factory(fake_smtp),
+            ),
         ):
-            sent = notifications.send_followup_reminder(
+            sent = await notifications.send_followup_reminder(
                 recipient="alice@example.com",
                 subject="Follow up",
                 sent_at=datetime(2026, 3, 24, 17, 0, tzinfo=timezone.utc),
@@ -164,15 +275,19 @@ class NotificationsTests(unittest.TestCase):
         self.assertTrue(sent)
         self.assertIn("Subject: Follow-up Reminder: Follow up", fake_smtp.sent[2])
 
-    def test_send_hot_conversation_notification_succeeds(self) -> None:
+    async def test_send_hot_conversation_notification_succeeds(self) -> None:
         fake_smtp = FakeSMTP("smtp.example.com", 587)
 
         with (
             patch.object(notifications, "settings", self._build_settings()),
             patch.object(notifications, "is_email_notifications_enabled", return_value=True),
-            patch.object(notifications.smtplib, "SMTP", return_value=fake_smtp),
+            patch.object(
+                notifications.aiosmtplib,
+                "SMTP",
+                side_effect=fake_smtp_factory(fake_smtp),
+            ),
         ):
-            sent = notifications.send_hot_conversation_notification(
+            sent = await notifications.send_hot_conversation_notification(
                 recipient="alice@example.com",
                 subject="Hello",
                 open_count=4,
@@ -182,15 +297,19 @@ class NotificationsTests(unittest.TestCase):
         self.assertTrue(sent)
         self.assertIn("Hot conversation", decode_subject(fake_smtp.sent[2]))
 
-    def test_send_revived_conversation_notification_succeeds(self) -> None:
+    async def test_send_revived_conversation_notification_succeeds(self) -> None:
         fake_smtp = FakeSMTP("smtp.example.com", 587)
 
         with (
             patch.object(notifications, "settings", self._build_settings()),
             patch.object(notifications, "is_email_notifications_enabled", return_value=True),
-            patch.object(notifications.smtplib, "SMTP", return_value=fake_smtp),
+            patch.object(
+                notifications.aiosmtplib,
+                "SMTP",
+                side_effect=fake_smtp_factory(fake_smtp),
+            ),
         ):
-            sent = notifications.send_revived_conversation_notification(
+            sent = await notifications.send_revived_conversation_notification(
                 recipient="alice@example.com",
                 subject="Hello",
                 days_since_first_open=20,
@@ -199,3 +318,95 @@ class NotificationsTests(unittest.TestCase):
 
         self.assertTrue(sent)
         self.assertIn("Old conversation revived", decode_subject(fake_smtp.sent[2]))
+
+    async def test_sends_reuse_one_pooled_smtp_connection(self) -> None:
+        fake_smtp = FakeSMTP("smtp.example.com", 587)
+
+        with (
+            patch.object(notifications, "settings", self._build_settings()),
+            patch.object(notifications, "is_email_notifications_enabled", return_value=True),
+            patch.object(
+                notifications.aiosmtplib,
+                "SMTP",
+                side_effect=fake_smtp_factory(fake_smtp),
+            ) as smtp_cls,
+        ):
+            for track_id in ("track-1", "track-2"):
+                self.assertTrue(
+                    await notifications.send_hot_conversation_notification(
+                        recipient="alice@example.com",
+                        subject="Hello",
+                        open_count=3,
+                        track_id=track_id,
+                    )
+                )
+            await notifications.close_smtp_connections()
+
+        smtp_cls.assert_called_once_with(
+            hostname="smtp.example.com",
+            port=587,
+            start_tls=True,
+        )
+        self.assertEqual(2, fake_smtp.send_count)
+        self.assertTrue(fake_smtp.closed)
+        self.assertEqual([], notifications._idle_smtp)
+
+    async def test_send_reconnects_when_pooled_connection_was_dropped(self) -> None:
+        stale_smtp = DisconnectedSMTP("smtp.example.com", 587)
+        fresh_smtp = FakeSMTP("smtp.example.com", 587)
+        notifications._idle_smtp.append(stale_smtp)
+
+        with (
+            patch.object(notifications, "settings", self._build_settings()),
+            patch.object(notifications, "is_email_notifications_enabled", return_value=True),
+            patch.object(
+                notifications.aiosmtplib,
+                "SMTP",
+                side_effect=fake_smtp_factory(fresh_smtp),
+            ),
+        ):
+            sent = await notifications.send_followup_reminder(
+                recipient="alice@example.com",
+                subject="Follow up",
+                sent_at=datetime(2026, 3, 24, 17, 0, tzinfo=timezone.utc),
+                days_ago=3,
+                track_id="track-2",
+            )
+
+        self.assertTrue(sent)
+        self.assertEqual(1, fresh_smtp.send_count)
+        self.assertEqual([fresh_smtp], notifications._idle_smtp)
+
+    async def test_concurrent_sends_use_separate_pooled_connections(self) -> None:
+        class SlowSMTP(FakeSMTP):
+            async def sendmail(self, sender: str, recipients: str, message: str) -> None:
+                await asyncio.sleep(0)
+                await super().sendmail(sender, recipients, message)
+
+        created = []
+
+        def build(*, hostname, port, start_tls):
+            fake_smtp = SlowSMTP(hostname, port)
+            created.append(fake_smtp)
+            return fake_smtp
+
+        with (
+            patch.object(notifications, "settings", self._build_settings()),
+            patch.object(notifications, "is_email_notifications_enabled", return_value=True),
+            patch.object(notifications.aiosmtplib, "SMTP", side_effect=build),
+        ):
+            results = await asyncio.gather(
+                *(
+                    notifications.send_hot_conversation_notification(
+                        recipient="alice@example.com",
+                        subject="Hello",
+                        open_count=3,
+                        track_id=f"track-{index}",
+                    )
+                    for index in range(notifications.SMTP_POOL_SIZE + 2)
+                )
+            )
+
+        self.assertTrue(all(results))
+        self.assertEqual(notifications.SMTP_POOL_SIZE, len(created))
+        self.assertEqual(notifications.SMTP_POOL_SIZE, len(notifications._idle_smtp))
@@ -119,9 +119,8 @@ class OpenActivityTests(unittest.IsolatedAsyncioTestCase):
         real_opened_at = datetime(2026, 3, 27, 13, 0, tzinfo=timezone.utc)
         unknown_proxy_opened_at = datetime(2026, 3, 27, 14, 0, tzinfo=timezone.utc)
         db = FakeAsyncSession([
-            ("track-1", proxy_opened_at, False, "apple"),
-            ("track-1", real_opened_at, True, None),
-            ("track-2", unknown_proxy_opened_at, False, None),
+            ("track-1", 2, 1, proxy_opened_at, real_opened_at, proxy_opened_at, "apple"),
+            ("track-2", 1, 0, unknown_proxy_opened_at.replace(tzinfo=None), None, None, None),
         ])
 
         summaries = await load_track_open_summaries(
@@ -142,6 +141,9 @@ class OpenActivityTests(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(summaries["track-2"].first_proxy_open)
         self.assertIsNone(summaries["track-2"].first_proxy_type)
 
+        compiled = str(db.queries[0])
+        self.assertIn("GROUP BY opens.tracked_email_id", compiled)
+
     async def test_load_real_open_events_normalizes_time_and_includes_location(self) -> None:
         opened_at = datetime(2026, 3, 27, 15, 0)
         db = FakeAsyncSession([
@@ -159,23 +161,28 @@ class OpenActivityTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual("United States", events[0].country)
         self.assertEqual("New York", events[0].city)
 
-    async def test_load_real_open_summaries_ignores_missing_timestamps_for_bounds(self) -> None:
-        first_opened_at = datetime(2026, 3, 27, 11, 0, tzinfo=timezone.utc)
+    async def test_load_real_open_summaries_reads_grouped_bounds(self) -> None:
+        first_opened_at = datetime(2026, 3, 27, 11, 0)
         last_opened_at = datetime(2026, 3, 27, 16, 0, tzinfo=timezone.utc)
         db = FakeAsyncSession([
-            ("track-1", None),
-            ("track-1", last_opened_at),
-            ("track-1", first_opened_at),
+            ("track-1", 3, first_opened_at, last_opened_at),
+            ("track-2", 1, None, None),
         ])
 
         summaries = await load_real_open_summaries(
             db,
-            track_ids=["track-1"],
+            track_ids=["track-1", "track-2"],
         )
 
         self.assertEqual(3, summaries["track-1"].count)
-        self.assertEqual(first_opened_at, summaries["track-1"].first_open_at)
+        self.assertEqual(first_opened_at.replace(tzinfo=timezone.utc), summaries["track-1"].first_open_at)
         self.assertEqual(last_opened_at, summaries["track-1"].last_open_at)
+        self.assertEqual(1, summaries["track-2"].count)
+        self.assertIsNone(summaries["track-2"].first_open_at)
+
+        compiled = str(db.queries[0])
+        self.assertIn("GROUP BY opens.tracked_email_id", compiled)
+        self.assertIn("opens.is_real_open IS true", compiled)
 
     async def test_load_recent_real_open_records_paginates_with_cursor(self) -> None:
         first_opened_at = datetime(2026, 3, 27, 18, 0, tzinfo=timezone.utc)
@@ -0,0 +1,92 @@
+import ipaddress
+import unittest
+
+from app import proxy_detection
+from app.proxy_detection import detect_proxy_type, is_microsoft_hosted_ip
+
+
+class DetectProxyTypeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        proxy_detection._detect_proxy_type_cached.cache_clear()
+        self.addCleanup(proxy_detection._detect_proxy_type_cached.cache_clear)
+
+    def test_matches_known_proxy_ranges_at_their_boundaries(self) -> None:
+        cases = {
+            "17.0.0.0": "apple",
+            "17.255.255.255": "apple",
+            "104.28.12.34": "apple",
+            "66.102.15.255": "google",
+            "74.125.210.1": "google",
+            "209.85.255.255": "google",
+            "16.255.255.255": None,
+            "66.102.16.0": None,
+            "209.85.127.255": None,
+            "8.8.8.8": None,
+            "2001:db8::1": None,
+        }
+
+        for ip_str, expected in cases.items():
+            with self.subTest(ip_str=ip_str):
+                self.assertEqual(expected, detect_proxy_type(ip_str, "Mozilla/5.0 (Windows)"))
+
+    def test_agrees_with_network_membership_for_every_range(self) -> None:
+        labelled_ranges = [
+            ("apple", proxy_detection.APPLE_IP_RANGES),
+            ("google", proxy_detection.GOOGLE_PROXY_RANGES),
+        ]
+
+        for label, networks in labelled_ranges:
+            for network in networks:
+                for ip in (network.network_address, network.broadcast_address):
+                    with self.subTest(ip=str(ip)):
+                        self.assertEqual(label, detect_proxy_type(str(ip)))
+                outside = ipaddress.ip_address(int(network.broadcast_address) + 1)
+                with self.subTest(ip=str(outside)):
+                    self.assertIsNone(detect_proxy_type(str(outside)))
+
+    def test_akamai_range_requires_generic_user_agent(self) -> None:
+        self.assertEqual("apple", detect_proxy_type("172.226.188.13", "Mozilla/5.0"))
+        self.assertEqual("apple", detect_proxy_type("172.226.188.13", ""))
+        self.assertIsNone(
+            detect_proxy_type("172.226.188.13", "Mozilla/5.0 (Windows NT 10.0)")
+        )
+
+    def test_falls_back_to_user_agent_and_ignores_invalid_ips(self) -> None:
+        self.assertEqual("google", detect_proxy_type("8.8.8.8", "GoogleImageProxy"))
+        self.assertEqual(
+            "google",
+            detect_proxy_type("8.8.4.4", "Mozilla/5.0 (via ggpht.com GoogleImageProxy)"),
+        )
+        self.assertEqual("google", detect_proxy_type("1.1.1.1", "lh3.GGPHT.com fetcher"))
+        self.assertIsNone(detect_proxy_type("1.1.1.1", "ggphtXcom"))
+        self.assertEqual("apple", detect_proxy_type("8.8.8.8", "Apple Mail/16.0"))
+        self.assertEqual("apple", detect_proxy_type("8.8.8.8", "Mail/3.0 (Apple)"))
+        self.assertEqual("google", detect_proxy_type("2001:db8::1", "GoogleImageProxy"))
+        self.assertIsNone(detect_proxy_type("not-an-ip", "GoogleImageProxy"))
+        self.assertIsNone(detect_proxy_type("17.0.0", "GoogleImageProxy"))
+        self.assertIsNone(detect_proxy_type("017.0.0.1", "GoogleImageProxy"))
+        self.assertIsNone(detect_proxy_type("", "GoogleImageProxy"))
+
+    def test_caches_results_case_insensitively_by_user_agent(self) -> None:
+        self.assertEqual("google", detect_proxy_type("8.8.8.8", "GoogleImageProxy"))
+        self.assertEqual("google", detect_proxy_type("8.8.8.8", "googleimageproxy"))
+        self.assertEqual("apple", detect_proxy_type("172.226.188.13", " MOZILLA/5.0 "))
+
+        cache_info = proxy_detection._detect_proxy_type_cached.cache_info()
+        self.assertEqual(1, cache_info.hits)
+        self.assertEqual(2, cache_info.misses)
+
+
+class IsMicrosoftHostedIpTests(unittest.TestCase):
+    def test_matches_hosted_ranges_only(self) -> None:
+        self.assertTrue(is_microsoft_hosted_ip("51.54.0.1"))
+        self.assertTrue(is_microsoft_hosted_ip("51.59.255.255"))
+        self.assertFalse(is_microsoft_hosted_ip("51.53.255.255"))
+        self.assertFalse(is_microsoft_hosted_ip("51.60.0.0"))
+        self.assertFalse(is_microsoft_hosted_ip("::1"))
+        self.assertFalse(is_microsoft_hosted_ip("bogus"))
+        self.assertFalse(is_microsoft_hosted_ip(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 from fastapi import HTTPException
 
-from app.services import recipients
+from app.services import dashboard_cache, recipients
 from app.services.open_activity import TrackRealOpenSummary
 from app.services.recipients import RecipientTrackSnapshot
 
@@ -34,6 +34,9 @@ class FrozenDateTime(datetime):
 
 
 class RecipientsServiceTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        dashboard_cache.invalidate_dashboard_cache()
+
     async def test_build_recipients_context_uses_default_sorting_and_pagination_bounds(self) -> None:
         recipient_list = [
             {"email": "bob@example.com", "email_lower": "bob@example.com", "sent": 3, "opened": 1, "open_rate": 33.3, "last_open": None, "last_open_display": "Never", "score": 10, "score_label": "Unengaged"},
@@ -138,6 +141,27 @@ class RecipientsServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn("%alice%", db.queries[0].compile().params.values())
         finalize_recipient_list.assert_called_once()
 
+    async def test_load_recipient_list_reuses_cached_counts_until_invalidated(self) -> None:
+        db = FakeAsyncSession([("track-1", "alice@example.com")])
+        summaries = {
+            "track-1": TrackRealOpenSummary(
+                count=1,
+                first_open_at=datetime(2026, 3, 20, 12, 0, tzinfo=timezone.utc),
+                last_open_at=datetime(2026, 3, 20, 12, 0, tzinfo=timezone.utc),
+            ),
+        }
+        now = FrozenDateTime.now(timezone.utc)
+
+        with patch.object(recipients, "load_real_open_summaries", AsyncMock(return_value=summaries)):
+            first = await recipients._load_recipient_list(db, now=now)
+            second = await recipients._load_recipient_list(db, now=now)
+            dashboard_cache.invalidate_dashboard_cache()
+            await recipients._load_recipient_list(db, now=now)
+
+        self.assertEqual(first, second)
+        self.assertEqual(1, second[0]["opened"])
+        self.assertEqual(2, len(db.queries))
+
     async def test_accumulate_recipient_batch_tracks_multiple_recipients_and_last_open(self) -> None:
         recipient_map = {}
         summaries = {
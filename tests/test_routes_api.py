@@ -1,10 +1,13 @@
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from app.open_snapshot import build_open_snapshot
 from app.routes import api as api_routes
+from app.services.open_activity import TrackOpenRecord
 
 
 class RoutesApiTests(unittest.TestCase):
@@ -67,3 +70,46 @@ class RoutesApiTests(unittest.TestCase):
             response.json(),
         )
         get_api_stats.assert_awaited_once_with(fake_db)
+
+    def test_track_opens_serializes_open_records(self) -> None:
+        client, fake_db = self._build_client()
+        open_record = build_open_snapshot(
+            TrackOpenRecord,
+            tracked_email_id="track-1",
+            id=7,
+            referer=None,
+            opened_at=datetime(2026, 3, 27, 13, 0, tzinfo=timezone.utc),
+            ip_address="17.58.1.1",
+            user_agent="Mozilla/5.0",
+            country=None,
+            city=None,
+            proxy_type="apple",
+            is_real_open=False,
+        )
+        list_track_open_records = AsyncMock(return_value=[open_record])
+
+        with patch.object(api_routes, "list_track_open_records", list_track_open_records):
+            response = client.get(
+                "/api/tracks/track-1/opens",
+                headers={"X-API-Key": "test-api-key"},
+            )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            [
+                {
+                    "id": 7,
+                    "opened_at": "2026-03-27T13:00:00Z",
+                    "ip_address": "17.58.1.1",
+                    "user_agent": "Mozilla/5.0",
+                    "referer": None,
+                    "country": None,
+                    "city": None,
+                    "proxy_type": "apple",
+                    "is_real_open": False,
+                }
+            ],
+            response.json(),
+        )
+        list_track_open_records.assert_awaited_once_with(fake_db, "track-1")
+
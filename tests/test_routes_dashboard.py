@@ -10,6 +10,12 @@ from app.routes import dashboard as dashboard_routes
 
 
 class RoutesDashboardTests(unittest.TestCase):
+    def setUp(self) -> None:
+        dashboard_routes._login_failures.clear()
+        self.addCleanup(dashboard_routes._login_failures.clear)
+        dashboard_routes._render_static_login_page.cache_clear()
+        self.addCleanup(dashboard_routes._render_static_login_page.cache_clear)
+
     def _build_client(self) -> TestClient:
         app = FastAPI()
         app.add_middleware(
@@ -34,6 +40,28 @@ class RoutesDashboardTests(unittest.TestCase):
         self.assertEqual(303, response.status_code)
         self.assertEqual("/login", response.headers["location"])
 
+    def test_protected_routes_redirect_before_opening_a_db_session(self) -> None:
+        client = self._build_client()
+        db_calls = []
+
+        async def recording_db():
+            db_calls.append(True)
+            return object()
+
+        client.app.dependency_overrides[dashboard_routes.get_db] = recording_db
+
+        responses = [
+            client.get("/detail/track-1", follow_redirects=False),
+            client.post("/pin/track-1", follow_redirects=False),
+            client.get("/export", follow_redirects=False),
+            client.get("/recipients/alice@example.com", follow_redirects=False),
+        ]
+
+        for response in responses:
+            self.assertEqual(303, response.status_code)
+            self.assertEqual("/login", response.headers["location"])
+        self.assertEqual([], db_calls)
+
     def test_login_sets_session_and_allows_dashboard_access(self) -> None:
         client = self._build_client()
         build_dashboard_context = AsyncMock(
@@ -69,17 +97,68 @@ class RoutesDashboardTests(unittest.TestCase):
         self.assertEqual("dashboard.html", dashboard_response.text)
         build_dashboard_context.assert_awaited_once()
 
-    def test_login_with_invalid_credentials_renders_login_page(self) -> None:
+    def test_login_throttles_repeated_failures_per_client(self) -> None:
         client = self._build_client()
 
-        def fake_render_template(_request, name, context):
-            return HTMLResponse(f"{name}:{context.get('error')}")
-
-        with patch.object(dashboard_routes, "render_template", side_effect=fake_render_template):
-            response = client.post(
+        with patch.object(dashboard_routes, "LOGIN_MAX_FAILURES", 2):
+            failures = [
+                client.post("/login", data={"username": "wrong", "password": "nope"})
+                for _ in range(2)
+            ]
+            throttled = client.post(
                 "/login",
-                data={"username": "wrong", "password": "nope"},
+                data={"username": "test-user", "password": "test-password"},
+                follow_redirects=False,
             )
 
+        self.assertEqual([200, 200], [response.status_code for response in failures])
+        self.assertEqual(429, throttled.status_code)
+        self.assertIn("Too many failed attempts. Try again later.", throttled.text)
+
+    def test_login_failure_window_expires(self) -> None:
+        dashboard_routes._record_login_failure("203.0.113.7", 100.0)
+
+        with patch.object(dashboard_routes, "LOGIN_MAX_FAILURES", 1):
+            self.assertTrue(dashboard_routes._is_login_throttled("203.0.113.7", 101.0))
+            self.assertFalse(
+                dashboard_routes._is_login_throttled(
+                    "203.0.113.7",
+                    100.0 + dashboard_routes.LOGIN_FAILURE_WINDOW_SECONDS,
+                )
+            )
+
+        self.assertNotIn("203.0.113.7", dashboard_routes._login_failures)
+
+    def test_credentials_must_both_match(self) -> None:
+        self.assertTrue(dashboard_routes._credentials_match("test-user", "test-password"))
+        self.assertFalse(dashboard_routes._credentials_match("test-user", "wrong"))
+        self.assertFalse(dashboard_routes._credentials_match("wrong", "test-password"))
+        self.assertFalse(dashboard_routes._credentials_match("", ""))
+
+    def test_login_page_revalidates_with_etag(self) -> None:
+        client = self._build_client()
+
+        first_response = client.get("/login")
+        etag = first_response.headers["etag"]
+        cached_response = client.get("/login", headers={"If-None-Match": etag})
+        stale_response = client.get("/login", headers={"If-None-Match": '"stale"'})
+
+        self.assertEqual(200, first_response.status_code)
+        self.assertIn('action="/login"', first_response.text)
+        self.assertEqual("private, no-cache", first_response.headers["cache-control"])
+        self.assertEqual(304, cached_response.status_code)
+        self.assertEqual(b"", cached_response.content)
+        self.assertEqual(etag, cached_response.headers["etag"])
+        self.assertEqual(200, stale_response.status_code)
+
+    def test_login_with_invalid_credentials_renders_login_page(self) -> None:
+        client = self._build_client()
+
+        response = client.post(
+            "/login",
+            data={"username": "wrong", "password": "nope"},
+        )
+
         self.assertEqual(200, response.status_code)
-        self.assertEqual("login.html:Invalid credentials", response.text)
+        self.assertIn('<div class="error">Invalid credentials</div>', response.text)
+        self.assertIn('action="/login"', response.text)
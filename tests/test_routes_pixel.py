@@ -7,35 +7,40 @@ from fastapi.testclient import TestClient
 from app.routes import pixel as pixel_routes
 
 
-class FakeAsyncSession:
-    def __init__(self) -> None:
-        self.rollback_count = 0
-
-    async def rollback(self) -> None:
-        self.rollback_count += 1
-
-
 class RoutesPixelTests(unittest.TestCase):
     def _build_client(self):
         app = FastAPI()
         app.include_router(pixel_routes.router)
-        fake_db = FakeAsyncSession()
+        return TestClient(app)
+
+    def test_track_pixel_records_open_after_sending_gif(self) -> None:
+        client = self._build_client()
+        record_open = AsyncMock()
 
-        async def override_db():
-            return fake_db
+        with patch.object(pixel_routes, "record_pixel_open_in_background", record_open):
+            response = client.get(
+                "/p/track-1.gif",
+                headers={"User-Agent": "Mail/1.0", "Referer": "https://mail.example.com/"},
+            )
 
-        app.dependency_overrides[pixel_routes.get_db] = override_db
-        return TestClient(app), fake_db
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("image/gif", response.headers["content-type"])
+        self.assertEqual(pixel_routes.PIXEL_GIF, response.content)
+        record_open.assert_awaited_once()
+        tracking_id, pixel_client = record_open.await_args.args
+        self.assertEqual("track-1", tracking_id)
+        self.assertEqual("Mail/1.0", pixel_client.user_agent)
+        self.assertEqual("https://mail.example.com/", pixel_client.referer)
 
-    def test_track_pixel_returns_gif_even_when_recording_fails(self) -> None:
-        client, fake_db = self._build_client()
-        record_pixel_open = AsyncMock(side_effect=RuntimeError("boom"))
+    def test_track_pixel_sends_no_cache_headers(self) -> None:
+        client = self._build_client()
 
-        with patch.object(pixel_routes, "record_pixel_open", record_pixel_open):
+        with patch.object(pixel_routes, "record_pixel_open_in_background", AsyncMock()):
             response = client.get("/p/track-1.gif")
 
         self.assertEqual(200, response.status_code)
+        self.assertEqual("no-cache, no-store, must-revalidate", response.headers["cache-control"])
+        self.assertEqual("no-cache", response.headers["pragma"])
+        self.assertEqual("0", response.headers["expires"])
+        self.assertEqual(str(len(pixel_routes.PIXEL_GIF)), response.headers["content-length"])
         self.assertEqual("image/gif", response.headers["content-type"])
-        self.assertEqual(pixel_routes.PIXEL_GIF, response.content)
-        self.assertEqual(1, fake_db.rollback_count)
-        record_pixel_open.assert_awaited_once()
@@ -1,5 +1,6 @@
 import os
 import unittest
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
@@ -23,6 +24,9 @@ class FakeResult:
     def one_or_none(self):
         return self.row
 
+    def one(self):
+        return self.row
+
 
 class FakeAsyncSession:
     def __init__(self, row):
@@ -92,6 +96,14 @@ class RetryOnceAsyncSession(FakeAsyncSession):
         return FakeResult(self.row)
 
 
+def fake_session_factory(db):
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    return session
+
+
 class FrozenDateTime:
     @staticmethod
     def now(tz=None):
@@ -99,8 +111,11 @@ class FrozenDateTime:
 
 
 class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
-    def _build_request(self, headers: list[tuple[bytes, bytes]] | None = None) -> Request:
-        return Request(
+    def _build_client(
+        self,
+        headers: list[tuple[bytes, bytes]] | None = None,
+    ) -> tracking.PixelClient:
+        request = Request(
             {
                 "type": "http",
                 "http_version": "1.1",
@@ -115,10 +130,10 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
                 "server": ("testserver", 443),
             }
         )
+        return tracking.capture_pixel_client(request)
 
     async def test_record_pixel_open_sets_opened_at_in_utc_before_insert(self) -> None:
         frozen_now = FrozenDateTime.now()
-        request = self._build_request()
         db = FakeAsyncSession(
             (
                 "alice@example.com",
@@ -140,7 +155,7 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
             await tracking.record_pixel_open(
                 db,
                 "track-1",
-                request,
+                self._build_client(),
                 BackgroundTasks(),
             )
 
@@ -155,7 +170,7 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
         await tracking.record_pixel_open(
             db,
             "missing",
-            self._build_request(),
+            self._build_client(),
             BackgroundTasks(),
         )
 
@@ -179,7 +194,7 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
             await tracking.record_pixel_open(
                 db,
                 "track-1",
-                self._build_request(),
+                self._build_client(),
                 BackgroundTasks(),
             )
 
@@ -212,7 +227,7 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
             await tracking.record_pixel_open(
                 db,
                 "track-1",
-                self._build_request(),
+                self._build_client(),
                 background_tasks,
             )
 
@@ -248,7 +263,7 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
             await tracking.record_pixel_open(
                 db,
                 "track-1",
-                self._build_request(
+                self._build_client(
                     headers=[
                         (
                             b"user-agent",
@@ -283,8 +298,7 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
             ]
         )
         background_tasks = BackgroundTasks()
-        load_recent_real_open_count = AsyncMock(return_value=3)
-        load_first_real_open_at = AsyncMock(return_value=frozen_now - timedelta(days=20))
+        load_real_open_activity = AsyncMock(return_value=(3, frozen_now - timedelta(days=20)))
 
         with (
             patch.object(tracking, "datetime", FrozenDateTime),
@@ -292,19 +306,23 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
             patch.object(tracking, "classify_open", return_value=(True, None)),
             patch.object(tracking, "lookup_ip", return_value=("United States", "New York")),
             patch.object(tracking, "is_email_notifications_enabled", return_value=True),
-            patch.object(tracking, "_load_recent_real_open_count", load_recent_real_open_count),
-            patch.object(tracking, "_load_first_real_open_at", load_first_real_open_at),
+            patch.object(tracking, "_load_real_open_activity", load_real_open_activity),
         ):
             await tracking.record_pixel_open(
                 db,
                 "track-1",
-                self._build_request(),
+                self._build_client(),
                 background_tasks,
             )
 
         self.assertEqual(1, db.commits)
         self.assertEqual(1, db.flushes)
         self.assertEqual(3, len(background_tasks.tasks))
+        load_real_open_activity.assert_awaited_once_with(
+            db,
+            "track-1",
+            frozen_now - timedelta(hours=24),
+        )
         self.assertEqual(
             [
                 tracking.send_open_notification,
@@ -320,6 +338,23 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
             list(background_tasks.tasks[0].kwargs.keys()),
         )
 
+    async def test_load_real_open_activity_reads_recent_count_and_first_open_together(self) -> None:
+        first_open_at = datetime(2026, 3, 1, 12, 0)
+        db = FakeAsyncSession((2, first_open_at))
+
+        recent_count, first_real_open_at = await tracking._load_real_open_activity(
+            db,
+            "track-1",
+            datetime(2026, 3, 26, 18, 0, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(2, recent_count)
+        self.assertEqual(first_open_at.replace(tzinfo=timezone.utc), first_real_open_at)
+        self.assertEqual(1, len(db.queries))
+        compiled = str(db.queries[0])
+        self.assertIn("count(CASE WHEN (opens.opened_at >=", compiled)
+        self.assertIn("min(opens.opened_at)", compiled)
+
     async def test_record_pixel_open_retries_transient_mysql_deadlock(self) -> None:
         frozen_now = FrozenDateTime.now()
         deadlock_error = OperationalError(
@@ -350,7 +385,7 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
             await tracking.record_pixel_open(
                 db,
                 "track-1",
-                self._build_request(),
+                self._build_client(),
                 BackgroundTasks(),
             )
 
@@ -358,6 +393,34 @@ class TrackingServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(1, db.commits)
         self.assertEqual(1, len(db.added))
 
+    async def test_record_pixel_open_in_background_runs_queued_notifications(self) -> None:
+        db = FakeAsyncSession(None)
+        notify = AsyncMock()
+
+        async def fake_record(session, tracking_id, client, background_tasks) -> None:
+            self.assertIs(db, session)
+            background_tasks.add_task(notify, tracking_id)
+
+        with (
+            patch.object(tracking, "async_session", fake_session_factory(db)),
+            patch.object(tracking, "record_pixel_open", fake_record),
+        ):
+            await tracking.record_pixel_open_in_background("track-1", self._build_client())
+
+        notify.assert_awaited_once_with("track-1")
+
+    async def test_record_pixel_open_in_background_swallows_and_rolls_back_errors(self) -> None:
+        db = FakeAsyncSession(None)
+
+        with (
+            patch.object(tracking, "async_session", fake_session_factory(db)),
+            patch.object(tracking, "record_pixel_open", AsyncMock(side_effect=RuntimeError("boom"))),
+            self.assertLogs(tracking.logger, level="ERROR"),
+        ):
+            await tracking.record_pixel_open_in_background("track-1", self._build_client())
+
+        self.assertEqual(1, db.rollbacks)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest.mock import patch
 
 from fastapi import Request
 
@@ -10,7 +11,9 @@ os.environ.setdefault("BASE_URL", "https://example.com")
 os.environ.setdefault("DASHBOARD_USERNAME", "test-user")
 os.environ.setdefault("DASHBOARD_PASSWORD", "test-password")
 
-from app.web import render_template
+from jinja2 import FileSystemBytecodeCache
+
+from app.web import render_template, templates, warm_templates
 
 
 class RenderTemplateTests(unittest.TestCase):
@@ -36,3 +39,18 @@ class RenderTemplateTests(unittest.TestCase):
         self.assertEqual("login.html", response.template.name)
         self.assertIs(request, response.context["request"])
         self.assertIsNone(response.context["error"])
+
+    def test_templates_skip_reload_checks_and_cache_bytecode(self) -> None:
+        self.assertFalse(templates.env.auto_reload)
+        self.assertIsInstance(templates.env.bytecode_cache, FileSystemBytecodeCache)
+        self.assertTrue(templates.env.autoescape("login.html"))
+        self.assertIn("to_local", templates.env.globals)
+
+    def test_warm_templates_compiles_page_templates_only(self) -> None:
+        with patch.object(templates.env, "get_template") as get_template:
+            warm_templates()
+
+        warmed = {call.args[0] for call in get_template.call_args_list}
+        self.assertIn("dashboard.html", warmed)
+        self.assertIn("login.html", warmed)
+        self.assertFalse(any(name.startswith("emails/") for name in warmed))